@@ -11,7 +11,16 @@
 @date 17July17
 """
 
-from math import sqrt, log
+import numpy as np
+import weakref
+
+from math import fsum
+
+# Energy conversion factors to J for the supported edge units
+_EDGE_UNITS = {'MeV': 1.602E-13, 'keV': 1.602E-16, 'eV': 1.602E-19}
+
+# Supported bin edge locations
+_EDGE_LOCS = frozenset(('low', 'mid', 'up'))
 
 #------------------------------------------------------------------------------#
 def bin_integration(edges, data, edgeLoc="low", lethargy=False):
@@ -22,9 +31,10 @@ def bin_integration(edges, data, edgeLoc="low", lethargy=False):
     differential flux to flux.  Valid for binned data with edge or midpoint
     values if properly specified in the inputs.
 
-    @param edges: <em> list or array of floats </em> \n
+    @param edges: <em> list or array of floats or BinEdges </em> \n
         The lower or upper bin energies.  This list should have a size that is
-        one greater than the size of the data. \n
+        one greater than the size of the data.  A BinEdges object is used
+        as is, ignoring edgeLoc. \n
     @param data: <em> list or array of floats </em> \n
         The data corresponding to the bin structure.  This should be of
         len(edges)-1 \n
@@ -34,22 +44,55 @@ def bin_integration(edges, data, edgeLoc="low", lethargy=False):
     @param lethargy: \e boolean \n
         Specifies whether the integration is done with logarithmic bins. \n
 
-    @return <em> list of floats </em>: The integrated data
+    @return <em> array of floats </em>: The integrated data. float32
+        input data gives a float32 result, all other input gives float64. \n
     """
 
-    f = []
-
-    edges = check_data(edges, data, edgeLoc)
+    be = _as_bin_edges(edges, data, edgeLoc)
+    data = np.asarray(data, dtype=be.edges.dtype)
 
     # Integrate according to the type of binning provided
     if lethargy:
-        for i in range(0, len(data)):
-            f.append(log(edges[i+1]/edges[i])*data[i])
-    else:
-        for i in range(0, len(data)):
-            f.append((edges[i+1]-edges[i])*data[i])
+        return be.logRatio*data
 
-    return f
+    return be.width*data
+
+#------------------------------------------------------------------------------#
+def bin_integration_batch(edges, data, edgeLoc="low", lethargy=False):
+    """!
+    @ingroup DataManipulation
+
+    Integrates many sets of binned data that share the same bin structure in
+    a single broadcast operation.  Equivalent to calling bin_integration on
+    each row of data.
+
+    @param edges: <em> list or array of floats or BinEdges </em> \n
+        The lower or upper bin energies.  This list should have a size that is
+        one greater than the number of bins.  A BinEdges object is used as
+        is, ignoring edgeLoc. \n
+    @param data: <em> 2D list or array of floats </em> \n
+        The data sets with shape (number of data sets, number of bins). \n
+    @param edgeLoc: \e string \n
+        Indicator for the location of the energy boundary edges.  Options
+        are "low", "mid", or "up"
+    @param lethargy: \e boolean \n
+        Specifies whether the integration is done with logarithmic bins. \n
+
+    @return <em> 2D array of floats </em>: The integrated data sets. float32
+        input data gives a float32 result, all other input gives float64. \n
+    """
+
+    dtype = edges.edges.dtype if isinstance(edges, BinEdges) \
+            else _float_type(data)
+    data = np.asarray(data, dtype=dtype)
+    assert data.ndim == 2, "The data must be a 2D array of data sets."
+
+    be = _as_bin_edges(edges, data[0], edgeLoc)
+
+    if lethargy:
+        return be.logRatio*data
+
+    return be.width*data
 
 #------------------------------------------------------------------------------#
 def bin_differentiation(edges, data, edgeLoc="low", lethargy=False):
@@ -60,9 +103,10 @@ def bin_differentiation(edges, data, edgeLoc="low", lethargy=False):
     flux to differntial flux.  Valid for binned data with edge or midpoint
     values if properly specified in the inputs.
 
-    @param edges: <em> list or array of floats </em> \n
+    @param edges: <em> list or array of floats or BinEdges </em> \n
         The lower or upper bin energies.  This list should have a size that is
-        one greater than the size of the data. \n
+        one greater than the size of the data.  A BinEdges object is used
+        as is, ignoring edgeLoc. \n
     @param data: <em> list or array of floats </em> \n
         The data corresponding to the bin structure.  This should be of
         len(edges)-1. \n
@@ -73,34 +117,25 @@ def bin_differentiation(edges, data, edgeLoc="low", lethargy=False):
         Specifies whether to take the differential as a function of
         ln(dBin). \n
 
-    @return <em> list of floats </em>: The differentiated data
+    @return <em> array of floats </em>: The differentiated data. float32
+        input data gives a float32 result, all other input gives float64. \n
     """
 
-    f = []
-
-    edges = check_data(edges, data, edgeLoc)
-
-    # Differntiate bin by bin
-    if edgeLoc == 'low':
-        for i in range(0, len(data)):
-            if lethargy:
-                f.append(data[i]/log(edges[i+1]/float(edges[i])))
-            else:
-                f.append(data[i]/(edges[i+1]-edges[i]))
-    if edgeLoc == 'up':
-        if lethargy:
-            if edges[0] <=0:
-                edges[0] = 1E-10
-        for i in range(1, len(data)+1):
-            if lethargy:
-                f.append(data[i-1]/log(edges[i]/float(edges[i-1])))
-            else:
-                f.append(data[i-1]/(edges[i]-edges[i-1]))
-        
+    be = _as_bin_edges(edges, data, edgeLoc)
+    data = np.asarray(data, dtype=be.edges.dtype)
+
+    # Differentiate all bins at once
+    if not lethargy:
+        return data/be.width
+    f = data/be.logRatio
+    # Keep the logarithm finite for a zero or negative lowest upper edge
+    if be.edgeLoc == 'up' and be.lo[0] <= 0:
+        f[0] = data[0]/np.log(be.hi[0]/1E-10)
+
     return f
 
 #------------------------------------------------------------------------------#
-def normAUBC(data):
+def normAUBC(data, inplace=False):
     """!
     @ingroup DataManipulation
 
@@ -108,21 +143,30 @@ def normAUBC(data):
 
     @param data: <em> list or array of floats </em>
         The input data
+    @param inplace: \e boolean \n
+        Optional specifier to normalize a writable float32 or float64 array
+        in place instead of allocating a new array.  Ignored for other
+        input. \n
 
-    @return <em> list or array of floats </em>: The normalized data
+    @return <em> array of floats </em>: The normalized data. float32
+        input data gives a float32 result, all other input gives float64. \n
     """
 
-    try:
-        f = data/sum(data)
-    except TypeError:
-        sumData = 0
-        f = []
-        for i in range(0, len(data)):
-            sumData += data[i]
-        for i in range(0, len(data)):
-            f.append(data[i]/sumData)
+    dtype = _float_type(data)
+    if inplace and isinstance(data, np.ndarray) and data.dtype == dtype \
+       and data.flags.writeable:
+        np.divide(data, data.sum(), out=data)
+        return data
 
-    return f
+    # Python sequences are summed with compensated summation in a single C
+    # call before conversion, which also avoids a second pass over the array
+    if not isinstance(data, np.ndarray):
+        total = fsum(data)
+        return np.asarray(data, dtype=dtype)/total
+
+    data = np.asarray(data, dtype=dtype)
+
+    return data/data.sum()
 
 #------------------------------------------------------------------------------#
 def bin_intensity_to_flux(edges, data, edgeUnits='MeV', edgeLoc="low",
@@ -140,9 +184,14 @@ def bin_intensity_to_flux(edges, data, edgeUnits='MeV', edgeLoc="low",
     the data to the correct units. The neutron velocity is calculated from the
     mid-point of each bin.
 
-    @param edges: <em> list or array of floats </em> \n
+    The velocities are cached per edges object so repeated calls with the same
+    bin structure only rescale the data.  Call clear_velocity_cache() if the
+    edges are modified in place between calls.
+
+    @param edges: <em> list or array of floats or BinEdges </em> \n
         The lower or upper bin energies.  This list should have a size that is
-        one greater than the size of the data. \n
+        one greater than the size of the data.  A BinEdges object is used
+        as is, ignoring edgeLoc. \n
     @param data: <em> list or array of floats </em> \n
         The data corresponding to the bin structure.  This should be of
         len(edges)-1. \n
@@ -155,37 +204,214 @@ def bin_intensity_to_flux(edges, data, edgeUnits='MeV', edgeLoc="low",
     @param detectionVolume: <em> integer or float </em> \n
         Normalization to convert the data to neutron density. \n
 
-    @return <em> list of floats </em>: The flux data.
+    @return <em> array of floats </em>: The flux data. float32
+        input data gives a float32 result, all other input gives float64. \n
     """
 
-    assert edgeUnits == "MeV" or edgeUnits == "keV" or edgeUnits == "eV", \
-      "Valid specifications for the edge units are 'MeV', 'keV', or 'eV'."
+    v = _bin_velocity(edges, data, edgeUnits, edgeLoc)
 
-    # Initialize variables
-    f = []
-    neutronMass = 1.674929E-27
-    if edgeUnits == 'MeV':
-        energy = 1.602E-13
-    elif edgeUnits == 'keV':
-        energy = 1.602E-16
-    elif edgeUnits == 'eV':
-        energy = 1.602E-19
+    # Convert to flux, skipping the extra pass for the default unit volume
+    f = np.multiply(v, np.asarray(data, dtype=v.dtype))
+    if detectionVolume != 1:
+        f /= detectionVolume
 
-    edges = check_data(edges, data, edgeLoc)
+    return f
+
+#------------------------------------------------------------------------------#
+def bin_intensity_to_flux_batch(edges, data, edgeUnits='MeV', edgeLoc="low",
+                                detectionVolume=1):
+    """!
+    @ingroup DataManipulation
 
-    # Convert to flux
-    for i in range(0, len(data)):
-        v = sqrt(2*((edges[i+1]+edges[i])/2*energy)/neutronMass)
-        f.append(v*data[i]/detectionVolume)
+    Converts many sets of neutron intensity data that share the same bin
+    structure to flux in a single broadcast operation.  Equivalent to calling
+    bin_intensity_to_flux on each row of data.
+
+    @param edges: <em> list or array of floats or BinEdges </em> \n
+        The lower or upper bin energies.  This list should have a size that is
+        one greater than the number of bins.  A BinEdges object is used as
+        is, ignoring edgeLoc. \n
+    @param data: <em> 2D list or array of floats </em> \n
+        The data sets with shape (number of data sets, number of bins). \n
+    @param edgeUnits: \e string \n
+        Specifies the energy units.  Valid options are 'MeV', 'keV', or
+        'eV.' \n
+    @param edgeLoc: \e string \n
+        Indicator for the location of the energy boundary edges.  Options
+        are "low", "mid", or "up." \n
+    @param detectionVolume: <em> integer or float </em> \n
+        Normalization to convert the data to neutron density. \n
+
+    @return <em> 2D array of floats </em>: The flux data sets. float32
+        input data gives a float32 result, all other input gives float64. \n
+    """
+
+    dtype = edges.edges.dtype if isinstance(edges, BinEdges) \
+            else _float_type(data)
+    data = np.asarray(data, dtype=dtype)
+    assert data.ndim == 2, "The data must be a 2D array of data sets."
+
+    f = _bin_velocity(edges, data[0], edgeUnits, edgeLoc)*data
+    if detectionVolume != 1:
+        f /= detectionVolume
 
     return f
 
+#------------------------------------------------------------------------------#
+def clear_velocity_cache():
+    """!
+    @ingroup DataManipulation
+
+    Clears the bin velocities cached by bin_intensity_to_flux.  Required if
+    a set of edges is modified in place after being used for a conversion.
+    """
+
+    _VELOCITY_CACHE.clear()
+
+#------------------------------------------------------------------------------#
+class BinEdges(object):
+    """!
+    @ingroup DataManipulation
+
+    Holds the bin boundaries produced by check_data so that several of the
+    binned data routines can share one bin structure.  The derived arrays are
+    computed on first use and then reused, so they must not be modified by
+    the caller.  Build a new object if the edges change.
+    """
+
+    def __init__(self, edges, data, edgeLoc="low"):
+        """!
+        Constructor to build the bin structure.
+
+        @param self: <em> BinEdges pointer </em> \n
+            The BinEdges pointer. \n
+        @param edges: <em> list or array of floats </em> \n
+            The lower, mid, or upper bin energies. \n
+        @param data: <em> list or array of floats </em> \n
+            The data corresponding to the bin structure.  Only its length and
+            type are used. \n
+        @param edgeLoc: \e string \n
+            Indicator for the location of the energy boundary edges.  Options
+            are "low", "mid", or "up." \n
+        """
+
+        ## @var edges
+        # <em> array of floats </em>: All len(data)+1 bin boundaries
+        self.edges = check_data(edges, data, edgeLoc)[:len(data)+1]
+        ## @var edgeLoc
+        # \e string: The location of the input edges
+        self.edgeLoc = edgeLoc
+        ## @var lo
+        # <em> array of floats </em>: The lower bin boundaries
+        self.lo = self.edges[:-1]
+        ## @var hi
+        # <em> array of floats </em>: The upper bin boundaries
+        self.hi = self.edges[1:]
+
+        self._mid = None
+        self._width = None
+        self._logRatio = None
+        self._velocity = {}
+
+    def __len__(self):
+        """!
+        Returns the number of bins.
+
+        @param self: <em> BinEdges pointer </em> \n
+            The BinEdges pointer. \n
+
+        @return \e integer: The number of bins. \n
+        """
+
+        return len(self.lo)
+
+    @property
+    def mid(self):
+        """!
+        The mid-point of every bin.
+
+        @param self: <em> BinEdges pointer </em> \n
+            The BinEdges pointer. \n
+
+        @return <em> array of floats </em>: The bin mid-points. \n
+        """
+
+        if self._mid is None:
+            self._mid = np.add(self.lo, self.hi)
+            self._mid *= 0.5
+
+        return self._mid
+
+    @property
+    def width(self):
+        """!
+        The linear width of every bin.
+
+        @param self: <em> BinEdges pointer </em> \n
+            The BinEdges pointer. \n
+
+        @return <em> array of floats </em>: The bin widths hi-lo. \n
+        """
+
+        if self._width is None:
+            self._width = np.subtract(self.hi, self.lo)
+
+        return self._width
+
+    @property
+    def logRatio(self):
+        """!
+        The logarithmic (lethargy) width of every bin.
+
+        @param self: <em> BinEdges pointer </em> \n
+            The BinEdges pointer. \n
+
+        @return <em> array of floats </em>: The bin widths ln(hi/lo). \n
+        """
+
+        if self._logRatio is None:
+            self._logRatio = np.divide(self.hi, self.lo)
+            np.log(self._logRatio, out=self._logRatio)
+
+        return self._logRatio
+
+    def velocity(self, edgeUnits='MeV'):
+        """!
+        The neutron velocity at the mid-point of every bin in m/s.
+
+        @param self: <em> BinEdges pointer </em> \n
+            The BinEdges pointer. \n
+        @param edgeUnits: \e string \n
+            Specifies the energy units.  Valid options are 'MeV', 'keV', or
+            'eV.' \n
+
+        @return <em> array of floats </em>: The bin velocities. \n
+        """
+
+        if edgeUnits not in self._velocity:
+            neutronMass = 1.674929E-27
+            try:
+                energy = _EDGE_UNITS[edgeUnits]
+            except KeyError:
+                raise AssertionError("Valid specifications for the edge "
+                                     "units are 'MeV', 'keV', or 'eV'.")
+
+            # The scalar factors of v = sqrt(2*E_mid/m) are folded together
+            # before touching the arrays since E_mid = (E_low+E_up)/2. All
+            # steps reuse a single buffer.
+            v = np.add(self.hi, self.lo)
+            v *= energy/neutronMass
+            np.sqrt(v, out=v)
+            self._velocity[edgeUnits] = v
+
+        return self._velocity[edgeUnits]
+
 #------------------------------------------------------------------------------#
 def check_data(edges, data, edgeLoc="low"):
     """!
     @ingroup DataManipulation
 
-    Checks the data, converts to lists if necessary, and adds the appropriate
+    Checks the data, converts to arrays if necessary, and adds the appropriate
     edges for the calculation.
 
     @param edges: <em> list or array of floats </em> \n
@@ -198,36 +424,228 @@ def check_data(edges, data, edgeLoc="low"):
         Indicator for the location of the energy boundary edges.  Options
         are "low", "mid", or "up." \n
 
-    @return <em> list of floats </em>: The modified edges.
+    @return <em> array of floats </em>: The modified edges. float32
+        input data gives a float32 result, all other input gives float64. \n
     """
 
-    assert edgeLoc == "low" or edgeLoc == "mid" or edgeLoc == "up", \
+    assert edgeLoc in _EDGE_LOCS, \
       "Valid specifications for the edge location are 'low', 'mid', or 'up'."
 
-    f = []
+    edges = np.asarray(edges, dtype=_float_type(data))
 
-    # Check for expected data consistency
+    # Check for expected data consistency. New arrays are built so that the
+    # caller's edges are never modified.
     if edgeLoc == "low":
         if len(edges) == len(data):
-            try:
-                edges.append(edges[-1]+(edges[-1]-edges[-2]))
-            except (TypeError, AttributeError) as e:
-                edges = edges.tolist()
-                edges.append(edges[-1]+(edges[-1]-edges[-2]))
+            edges = np.concatenate((edges,
+                                    [edges[-1]+(edges[-1]-edges[-2])]))
     if edgeLoc == "up":
         if len(edges) == len(data):
-            try:
-                edges.insert(0, edges[0]-(edges[1]-edges[0]))
-            except (TypeError, AttributeError) as e:
-                edges = edges.tolist()
-                edges.insert(0, edges[0]-(edges[1]-edges[0]))
+            edges = np.concatenate(([edges[0]-(edges[1]-edges[0])],
+                                    edges))
     if edgeLoc == "mid":
-        tmp = []
-        width = edges[1]-edges[0]
-        tmp.append(edges[0]-0.5*width)
-        tmp.append(edges[0]+0.5*width)
-        for i in range(1, len(edges)):
-            width = edges[i]-edges[i-1]
-            tmp.append(edges[i]+0.5*width)
-        edges = tmp
+        # Each upper edge is the mid-point plus half of the width to the
+        # previous mid-point; the first bin reuses the second bin's width
+        widths = np.diff(edges)
+        if np.allclose(widths, widths[0], rtol=1E-9, atol=0):
+            # Uniform bins skip the temporaries of the general case
+            edges = np.linspace(edges[0]-0.5*widths[0],
+                                edges[-1]+0.5*widths[0], len(edges)+1,
+                                dtype=edges.dtype)
+        else:
+            widths = np.concatenate(([widths[0]], widths))
+            edges = np.concatenate(([edges[0]-0.5*widths[0]],
+                                    edges+0.5*widths))
     return edges
+
+#------------------------------------------------------------------------------#
+class BoundedCache(object):
+    """!
+    @ingroup DataManipulation
+    A dictionary of cached results that is emptied once it reaches a maximum
+    number of entries.  An entry can be tied to an owner object, such as the
+    array a result was computed from, and is then only returned for that same
+    object.  The owner is held through a weak reference where its type allows
+    one, so the cache does not keep it alive, and an entry whose owner has
+    been collected can not be matched by a new object that reuses its id.
+    """
+    def __init__(self, size=128):
+        """!
+        Constructor to build the BoundedCache class.
+
+        @param self: <em> object pointer </em> \n
+            The object pointer. \n
+        @param size: \e integer \n
+            The number of entries at which the cache is emptied. \n
+        """
+        ## @var size: \e integer
+        # The number of entries at which the cache is emptied.
+        self.size = size
+
+        ## @var _entries: \e dictionary
+        # The cached values and a reference to their owner keyed on the
+        # caller's key and the id of the owner.
+        self._entries = {}
+
+    def get(self, key, owner=None):
+        """!
+        Returns the value cached for a key and owner.
+
+        @param self: <em> BoundedCache pointer </em> \n
+            The BoundedCache pointer. \n
+        @param key: <em> hashable object </em> \n
+            The key of the cached value. \n
+        @param owner: \e object \n
+            Optional object that the value was cached for. \n
+
+        @return \e object: The cached value or None if there is none. \n
+        """
+        entry = self._entries.get(self._key(key, owner))
+        if entry is None:
+            return None
+        ref, value = entry
+        if owner is not None and ref() is not owner:
+            return None
+        return value
+
+    def put(self, key, value, owner=None):
+        """!
+        Caches a value for a key and owner.
+
+        @param self: <em> BoundedCache pointer </em> \n
+            The BoundedCache pointer. \n
+        @param key: <em> hashable object </em> \n
+            The key of the cached value. \n
+        @param value: \e object \n
+            The value to cache. \n
+        @param owner: \e object \n
+            Optional object that the value is cached for. \n
+        """
+        ref = None
+        if owner is not None:
+            try:
+                ref = weakref.ref(owner)
+            except TypeError:
+                ref = lambda: owner
+
+        if len(self._entries) >= self.size:
+            self._entries.clear()
+        self._entries[self._key(key, owner)] = (ref, value)
+
+    def clear(self):
+        """!
+        Removes all of the cached values.
+
+        @param self: <em> BoundedCache pointer </em> \n
+            The BoundedCache pointer. \n
+        """
+        self._entries.clear()
+
+    def __len__(self):
+        """!
+        Returns the number of cached values.
+
+        @param self: <em> BoundedCache pointer </em> \n
+            The BoundedCache pointer. \n
+        """
+        return len(self._entries)
+
+    @staticmethod
+    def _key(key, owner):
+        """!
+        Combines the caller's key with the id of the owner.
+
+        @param key: <em> hashable object </em> \n
+            The key of the cached value. \n
+        @param owner: \e object \n
+            The object that the value is cached for or None. \n
+
+        @return <em> hashable object </em>: The key of the entry. \n
+        """
+        if owner is None:
+            return key
+        return (id(owner), key)
+
+# BinEdges built by bin_intensity_to_flux for a raw edges object and its
+# binning options so that their velocities are reused
+_VELOCITY_CACHE = BoundedCache()
+
+#------------------------------------------------------------------------------#
+def _as_bin_edges(edges, data, edgeLoc="low"):
+    """!
+    @ingroup DataManipulation
+
+    Returns edges unchanged if they are already a BinEdges object, otherwise
+    wraps them in a new one.
+
+    @param edges: <em> list or array of floats or BinEdges </em> \n
+        The lower, mid, or upper bin energies. \n
+    @param data: <em> list or array of floats </em> \n
+        The data corresponding to the bin structure. \n
+    @param edgeLoc: \e string \n
+        Indicator for the location of the energy boundary edges.  Options
+        are "low", "mid", or "up." \n
+
+    @return \e BinEdges: The bin structure. \n
+    """
+
+    if isinstance(edges, BinEdges):
+        return edges
+
+    return BinEdges(edges, data, edgeLoc)
+
+#------------------------------------------------------------------------------#
+def _float_type(data):
+    """!
+    @ingroup DataManipulation
+
+    Selects the floating point type used for a calculation.  float32 input
+    data keeps its precision to halve the memory traffic for large spectra;
+    everything else is computed in float64.
+
+    @param data: <em> list or array of floats </em> \n
+        The input data. \n
+
+    @return \e type: np.float32 or np.float64 \n
+    """
+
+    if getattr(data, 'dtype', None) == np.float32:
+        return np.float32
+
+    return np.float64
+
+#------------------------------------------------------------------------------#
+def _bin_velocity(edges, data, edgeUnits='MeV', edgeLoc="low"):
+    """!
+    @ingroup DataManipulation
+
+    Returns the neutron velocity at the mid-point of every bin in m/s.  Raw
+    edges are wrapped in a BinEdges object that is cached per edges object
+    and binning options.  The result must not be modified by the caller.
+
+    @param edges: <em> list or array of floats or BinEdges </em> \n
+        The lower, mid, or upper bin energies. \n
+    @param data: <em> list or array of floats </em> \n
+        One data set corresponding to the bin structure. \n
+    @param edgeUnits: \e string \n
+        Specifies the energy units.  Valid options are 'MeV', 'keV', or
+        'eV.' \n
+    @param edgeLoc: \e string \n
+        Indicator for the location of the energy boundary edges.  Options
+        are "low", "mid", or "up." \n
+
+    @return <em> array of floats </em>: The bin velocities. \n
+    """
+
+    if isinstance(edges, BinEdges):
+        return edges.velocity(edgeUnits)
+
+    key = (edgeLoc, len(edges), len(data), _float_type(data))
+    be = _VELOCITY_CACHE.get(key, edges)
+    if be is not None:
+        return be.velocity(edgeUnits)
+
+    be = BinEdges(edges, data, edgeLoc)
+    _VELOCITY_CACHE.put(key, be, edges)
+
+    return be.velocity(edgeUnits)
@@ -12,15 +12,17 @@
 @date 17Jul17
 """
 
-import os
-
 import numpy as np
-import matplotlib.pyplot as plt
 
-from matplotlib.colors import LogNorm
+from math import floor, log10
+
+from DataManipulation import BinEdges, BoundedCache
+
+# matplotlib is imported by the plotting methods when they are first called,
+# which keeps it out of the import of this module for non-plotting uses
 
-from DataManipulation import check_data
-from Support.Plotting import plot
+# Colorbar ticks computed by plot2D keyed on the z axis options
+_TICK_CACHE = BoundedCache()
 
 #------------------------------------------------------------------------------#
 class Histogram(object):
@@ -81,6 +83,14 @@ class Histogram(object):
         # there should be N midpoint uncertainties.
         self.sigma = uncertainty
 
+        # Float arrays of the attributes above handed to the plotting
+        # routines, keyed on the attribute name.  Each entry keeps the
+        # attribute object it was built from so that reassigned attributes
+        # are converted again.
+        self._arrays = {}
+        # The figure from the last call to plot, reused by update
+        self._fig = None
+
     def __repr__(self):
         """!
         Histogram print function.
@@ -105,18 +115,15 @@ class Histogram(object):
         header = ["\nHistogram:"]
         header += ["X        Y"]
         header = "\n".join(header)+"\n"
-        tmp = ""
-        for i in range(0, len(self.xEdges)):
-            tmp += "{0:<7}{1}\n".format(self.xEdges[i], self.data[i])
-        header = header + tmp
-        header += "\nMid Point Data\n"
-        header += "X        Y       Sigma\n"
-        tmp = ""
-        for i in range(0, len(self.midPtX)):
-            tmp += "{0:<7} {1} {2}\n".format(self.midPtX[i], self.midPtData[i],
-                                             self.sigma[i])
-        header = header + tmp
-        return header
+        rows = ["{0:<7}{1}\n".format(x, y)
+                for x, y in zip(_as_values(self.xEdges),
+                              _as_values(self.data))]
+        rows += ["\nMid Point Data\n", "X        Y       Sigma\n"]
+        rows += ["{0:<7} {1} {2}\n".format(x, y, s)
+                 for x, y, s in zip(_as_values(self.midPtX),
+                                    _as_values(self.midPtData),
+                                    _as_values(self.sigma))]
+        return header + "".join(rows)
 
     def build_histo(self, edges, data, uncert=None, edgeLoc="low", name=''):
         """!
@@ -124,9 +131,11 @@ class Histogram(object):
 
         @param self: <em> histogram pointer </em> \n
             The histogram pointer. \n
-        @param edges: <em> list or array of floats </em> \n
+        @param edges: <em> list or array of floats or BinEdges </em> \n
             The lower or upper bin energies.  This list should have a size that
-            is one greater than the size of the data. \n
+            is one greater than the size of the data.  A BinEdges object is
+            used as is, ignoring edgeLoc, and its mid-points are shared with
+            the histogram. \n
         @param data: <em> list or array of floats </em> \n
             The data corresponding to the bin structure. \n
         @param uncert: <em> list or array of floats </em> \n
@@ -144,22 +153,96 @@ class Histogram(object):
         # Initialize variables
         self.label = name
         self.sigma = uncert
-        self.xEdges = []
-        self.data = []
-        self.midPtX = []
-        self.midPtData = []
 
-        # Check for expected data consistency
-        edges = check_data(edges, data, edgeLoc)
+        # Check for expected data consistency.  A prepared bin structure is
+        # reused as is, so many spectra on one grid only pay for it once.
+        bins = edges if isinstance(edges, BinEdges) \
+               else BinEdges(edges, data, edgeLoc)
+        data = np.asarray(data)
+
+        # Build histogram data by interleaving the lower and upper edge of
+        # each bin into preallocated arrays
+        self.xEdges = np.empty(2*len(bins), dtype=bins.edges.dtype)
+        self.xEdges[0::2] = bins.lo
+        self.xEdges[1::2] = bins.hi
+        self.data = np.empty(2*len(bins), dtype=data.dtype)
+        self.data[0::2] = data
+        self.data[1::2] = data
+        self.midPtX = bins.mid
+        self.midPtData = data
 
-        # Build histogram data
-        for i in range(1, len(data)+1):
-            self.xEdges.append(edges[i-1])
-            self.data.append(data[i-1])
-            self.xEdges.append(edges[i])
-            self.data.append(data[i-1])
-            self.midPtX.append((edges[i-1]+edges[i])/2.)
-            self.midPtData.append(data[i-1])
+    def build_from_events(self, events, bins, binRange=None, name=''):
+        """!
+        Builds a histogram object by counting raw events into bins.  The
+        uncertainty is the Poisson counting error.  Events outside of the
+        bins are ignored and the upper edge of the last bin is included, as in
+        np.histogram.
+
+        @param self: <em> histogram pointer </em> \n
+            The histogram pointer. \n
+        @param events: <em> list or array of floats </em> \n
+            The value of each event. \n
+        @param bins: <em> integer or list or array of floats </em> \n
+            The number of uniform bins or all of the bin edges. \n
+        @param binRange: <em> tuple of floats </em> \n
+            The lower and upper edge used with a number of bins.  Defaults to
+            the range of the events. \n
+        @param name: \e string \n
+            The name or label associated with the histogram data. \n
+        """
+
+        events = np.asarray(events, dtype=np.float64).ravel()
+        if np.ndim(bins) == 0:
+            if binRange is None:
+                binRange = (events.min(), events.max())
+            edges = np.linspace(binRange[0], binRange[1], bins+1)
+        else:
+            edges = np.asarray(bins, dtype=np.float64)
+
+        counts = _count_events(events, edges)
+        self.build_histo(edges, counts, uncert=np.sqrt(counts), name=name)
+
+    def build_from_numpy(self, histOutput, uncert=None, name=''):
+        """!
+        Builds a histogram object from the (counts, edges) output of
+        np.histogram.  float64 edges and array counts are stored without a
+        copy, so midPtData shares memory with the counts.
+
+        @param self: <em> histogram pointer </em> \n
+            The histogram pointer. \n
+        @param histOutput: <em> tuple of arrays </em> \n
+            The counts and the len(counts)+1 bin edges. \n
+        @param uncert: <em> list or array of floats </em> \n
+            The uncertainty corresponding to the counts. \n
+        @param name: \e string \n
+            The name or label associated with the histogram data. \n
+        """
+
+        counts, edges = histOutput
+        self.build_histo(edges, counts, uncert=uncert, name=name)
+
+    def accumulate(self, events):
+        """!
+        Adds the counts of more raw events to a histogram built from events,
+        updating the Poisson uncertainty.  The events are binned as in
+        build_from_events, so accumulating in chunks gives the counts of
+        np.histogram on all of the events.  Events outside of the bins are
+        ignored.
+
+        @param self: <em> histogram pointer </em> \n
+            The histogram pointer. \n
+        @param events: <em> list or array of floats </em> \n
+            The value of each event. \n
+        """
+
+        xEdges = self._as_array('xEdges')
+        edges = np.append(xEdges[0::2], xEdges[-1])
+        events = np.asarray(events, dtype=np.float64).ravel()
+
+        counts = _count_events(events, edges)
+        counts += np.asarray(self.midPtData, dtype=counts.dtype)
+        self.build_histo(edges, counts, uncert=np.sqrt(counts),
+                         name=self.label)
 
     def plot(self, *args, **kwargs):
         """!
@@ -168,7 +251,8 @@ class Histogram(object):
         @param self: <em> histogram pointer </em> \n
             The histogram pointer. \n
         @param args: \e histograms \n
-            An optional list of additional histograms to plot. \n
+            An optional list of additional histograms to plot.  Histograms
+            without any bins are skipped. \n
         @param kwargs: <em> optional plotting inputs </em> \n
             An optional list of additional plot MatPlotLib plot options.
             The supported options are listed in the plot function from
@@ -178,33 +262,93 @@ class Histogram(object):
             data is not available. \n
         """
 
-        # Set defaults if not specified since 2.7 sucks
-        xMin = kwargs.pop('xMin', 0)
-        xMax = kwargs.pop('xMax', max(self.xEdges)+1)
-        yMin = kwargs.pop('yMin', 0.5*min(y for y in self.data if y > 0))
-        yMax = kwargs.pop('yMax', 1.5*max(self.data))
+        from Support.Plotting import plot
+
+        # Set defaults if not specified since 2.7 sucks.  The axis limits are
+        # vectorized reductions over the cached arrays and are skipped when
+        # given.
+        if 'xMin' not in kwargs.keys():
+            kwargs['xMin'] = 0
+        if 'xMax' not in kwargs.keys():
+            kwargs['xMax'] = self._as_array('xEdges').max()+1
+        if 'yMin' not in kwargs.keys():
+            y = self._as_array('data')
+            y = y[y > 0]
+            kwargs['yMin'] = 0.5*y.min() if y.size else 1E-6
+        if 'yMax' not in kwargs.keys():
+            kwargs['yMax'] = 1.5*self._as_array('data').max()
         addMidPts = kwargs.pop('addMidPts', False)
 
-        # Organize plot data
+        # Organize plot data, leaving out overlays without any bins
+        args = [arg for arg in args
+                if arg.xEdges is not None and len(arg.xEdges) > 0]
+        # The histograms are drawn first and the mid-point data after them,
+        # both gathered in a single pass
         data = []
+        midPts = []
         label = []
-        data.append([self.xEdges, self.data])
-        label.append(self.label)
-        for arg in args:
-            data.append([arg.xEdges, arg.data])
-            label.append(arg.label)
-        if self.sigma != None:
-            data.append([self.midPtX, self.midPtData, self.sigma])
-        elif addMidPts:
-            data.append([self.midPtX, self.midPtData])
-        for arg in args:
-            if arg.sigma != None:
-                data.append([arg.midPtX, arg.midPtData, arg.sigma])
+        for hist in [self]+args:
+            data.append([hist._as_array('xEdges'), hist._as_array('data')])
+            label.append(hist.label)
+            if hist.sigma is not None:
+                midPts.append([hist._as_array('midPtX'),
+                               hist._as_array('midPtData'),
+                               hist._as_array('sigma')])
             elif addMidPts:
-                data.append([arg.midPtX, arg.midPtData, [0]*len(arg.midPtData)])
+                midPts.append([hist._as_array('midPtX'),
+                               hist._as_array('midPtData')])
+                if hist is not self:
+                    midPts[-1].append(np.zeros(len(hist.midPtData)))
+        data += midPts
 
-        plot(*data, dataLabel=label, xMin=xMin, xMax=xMax, yMin=yMin, yMax=yMax,
-             **kwargs)
+        self._fig = plot(*data, dataLabel=label, **kwargs)
+
+    def update(self):
+        """!
+        Redraws the histogram in the figure from the last call to plot with
+        the current edges and data.  Only the histogram line is updated, which
+        is much faster than building a new figure.
+
+        @param self: <em> histogram pointer </em> \n
+            The histogram pointer. \n
+
+        @return \e boolean: False if there is no open figure to update, in
+            which case plot must be called instead. \n
+        """
+
+        import matplotlib.pyplot as plt
+
+        if self._fig is None or not plt.fignum_exists(self._fig.number) \
+           or not self._fig.axes[0].lines:
+            return False
+
+        self._fig.axes[0].lines[0].set_data(self._as_array('xEdges'),
+                                            self._as_array('data'))
+        self._fig.canvas.draw_idle()
+
+        return True
+
+    def _as_array(self, name):
+        """!
+        Returns a histogram attribute as a float array.  The array is cached
+        until the attribute is reassigned, so repeated plots of the same
+        histogram do not convert list data again.
+
+        @param self: <em> histogram pointer </em> \n
+            The histogram pointer. \n
+        @param name: \e string \n
+            The name of the attribute, e.g. 'xEdges' or 'sigma'. \n
+
+        @return <em> array of floats </em>: The attribute values. \n
+        """
+
+        value = getattr(self, name)
+        cached = self._arrays.get(name)
+        if cached is None or cached[0] is not value:
+            cached = (value, np.asarray(value, dtype=np.float64))
+            self._arrays[name] = cached
+
+        return cached[1]
 
     def write(self, path, includeUncert=False, edge=False):
         """!
@@ -215,48 +359,38 @@ class Histogram(object):
         @param path: <em> kwargs string </em> \n
             Specification for the save location. Must include both path and
             name. \n
-        @param includeUncert: \e string \n
+        @param includeUncert: \e boolean \n
             An option to include the uncertainty in the output. \n
-        @param edge: \e string \n
+        @param edge: \e boolean \n
             An option to output the edges or midpoint values. \n
         """
 
-        if os.path.exists(path):
-            if os.path.isfile("{}.txt".format(path)):
-                os.remove("{}.txt".format(path))
+        # Stack the requested columns
+        if not edge:
+            cols = [self.midPtX, self.midPtData]
+            if includeUncert:
+                cols.append(self.sigma)
+        else:
+            cols = [self.xEdges, self.data]
+            if includeUncert:
+                # Each bin contributes a lower and an upper edge
+                cols.append(np.repeat(self.sigma, 2))
+
+        # Format every row up front so that the file gets a single write.
+        # Each column is converted on its own so that it keeps its type.
+        fmt = " ".join(["%s"]*len(cols))+"\n"
+        payload = "".join([fmt % row
+                           for row in zip(*[_as_values(c) for c in cols])])
 
         # Create and open input file
         try:
             with open("{}.txt".format(path), "w") as inpFile:
-                if edge == False:
-                    for i in range(len(self.midPtX)):
-                        if includeUncert == True:
-                            inpFile.write("{} {} {}\n".format(self.midPtX[i],
-                                                              self.midPtData[i],
-                                                              self.sigma[i]))
-                        else:
-                            inpFile.write("{} {}\n".format(self.midPtX[i],
-                                                           self.midPtData[i]))
-                else:
-                    for i in range(len(self.xEdges)):
-                        if includeUncert == True:
-                            inpFile.write("{} {} {}\n".format(self.xEdges[i],
-                                                             self.data[i],
-                                                             self.sigma[i/2]))
-                        else:
-                            inpFile.write("{} {}\n".format(self.xEdges[i],
-                                                           self.data[i]))
-
-            # Close the file
-            inpFile.close()
+                inpFile.write(payload)
 
         except IOError as e:
-            print "I/O error({0}): {1}".format(e.errno, e.strerror)
-            print "File not found was: {0}".format(path)
+            print("I/O error({0}): {1}".format(e.errno, e.strerror))
+            print("File not found was: {0}".format(path))
 
-        # Test that the file closed
-        assert inpFile.closed == True, "File did not close properly."
-        
     def diff(self, hist):
         """!
         Diffs two histograms and returns the absolute value.
@@ -276,7 +410,7 @@ class Histogram(object):
         histDiff = Histogram()
         histDiff.xEdges = self.xEdges
         histDiff.label = 'Difference between '+self.label+' and '+hist.label
-        if self.sigma != None:
+        if self.sigma is not None:
             histDiff.sigma = np.sqrt(np.asarray(self.sigma)**2\
                                    +np.asarray(hist.sigma[:len(self.sigma)])**2)
         histDiff.data = np.abs(np.asarray(self.data)\
@@ -313,7 +447,7 @@ class Histogram(object):
         histDiff.midPtData = np.abs(np.asarray(self.midPtData)\
                              -np.asarray(hist.midPtData[:len(self.midPtData)]))\
                              /np.asarray(self.midPtData) * 100.
-        if self.sigma != None:
+        if self.sigma is not None:
             histDiff.sigma = np.sqrt((np.asarray(self.sigma)\
                                       /np.asarray(self.midPtData))**2\
                                      +(np.asarray(hist.sigma[:len(self.sigma)])\
@@ -376,6 +510,10 @@ class Histogram2D(Histogram):
         # should be N midpoint y locations.
         self.midPtY = yMidPtLoc
 
+        # The log10 image drawn by plot2D for log scaled z axes, along with
+        # the data object it was computed from
+        self._logData = None
+
     def __repr__(self):
         """!
         2D Histogram print function.
@@ -402,24 +540,22 @@ class Histogram2D(Histogram):
         header = ["\nHistogram2D:"]
         header += ["X        Y       Z"]
         header = "\n".join(header)+"\n"
-        tmp = ""
-        for i in range(0, len(self.xEdges)):
-            for j in range(0, len(self.yEdges)):
-                tmp += "{0:<7}{1:<7}{2}\n".format(self.xEdges[i],
-                                                  self.yEdges[j],
-                                                  self.data[i, j])
-        header = header + tmp
-        header += "\nMid Point Data\n"
-        header += "X        Y       Z      Sigma\n"
-        tmp = ""
-        for i in range(0, len(self.midPtX)):
-            for j in range(0, len(self.midPtX)):
-                tmp += "{0:<7} {1} {2}\n".format(self.midPtX[i],
-                                                 self.midPtY[j],
-                                                 self.midPtData[i, j],
-                                                 self.sigma[i, j])
-        header = header + tmp
-        return header
+        # Each bin is listed by its lower x and y edge
+        data = np.asarray(self.data)
+        x, y = np.meshgrid(np.asarray(self.xEdges)[:data.shape[0]],
+                           np.asarray(self.yEdges)[:data.shape[1]],
+                           indexing='ij')
+        cols = np.column_stack((x.ravel(), y.ravel(), data.ravel()))
+        rows = ["%-7s%-7s%s\n" % tuple(row) for row in _as_values(cols)]
+        rows += ["\nMid Point Data\n", "X        Y       Z      Sigma\n"]
+        x, y = np.meshgrid(self.midPtX, self.midPtY, indexing='ij')
+        cols = [x.ravel(), y.ravel(), np.asarray(self.midPtData).ravel()]
+        fmt = "%-7s %s %s\n"
+        if self.sigma is not None:
+            cols.append(np.asarray(self.sigma).ravel())
+            fmt = "%-7s %s %s %s\n"
+        rows += [fmt % tuple(row) for row in _as_values(np.column_stack(cols))]
+        return header + "".join(rows)
 
     def build_2dHisto(self, xEdges, yEdges, data, uncert=None, xEdgeLoc='low',
                       yEdgeLoc='low', name=''):
@@ -454,72 +590,67 @@ class Histogram2D(Histogram):
         # Initialize variables
         self.label = name
         self.sigma = uncert
-        self.midPtX = []
-        self.midPtY = []
 
         # Check for expected data consistency
-        if xEdgeLoc == "low":
-            if len(xEdges) == len(data):
-                try:
-                    xEdges.append(xEdges[-1]+(xEdges[-1]-xEdges[-2]))
-                except TypeError:
-                    xEdges = xEdges.tolist()
-                    xEdges.append(xEdges[-1]+(xEdges[-1]-xEdges[-2]))
-        if yEdgeLoc == "low":
-            if len(yEdges) == len(data[0]):
-                try:
-                    yEdges.append(yEdges[-1]+(yEdges[-1]-yEdges[-2]))
-                except TypeError:
-                    yEdges = yEdges.tolist()
-                    yEdges.append(xEdges[-1]+(yEdges[-1]-yEdges[-2]))
-
-        if xEdgeLoc == "up":
-            if len(xEdges) == len(data):
-                try:
-                    xEdges.insert(0, 0)
-                except TypeError:
-                    xEdges = xEdges.tolist()
-                    xEdges.insert(0, 0)
-        if xEdgeLoc == "up":
-            if len(yEdges) == len(data):
-                try:
-                    yEdges.insert(0, 0)
-                except TypeError:
-                    yEdges = yEdges.tolist()
-                    yEdges.insert(0, 0)
-
-        if xEdgeLoc == "mid":
-            tmp = []
-            width = xEdges[1]-xEdges[0]
-            tmp.append(xEdges[0]-0.5*width)
-            for i in range(1, len(xEdges)):
-                width = xEdges[i]-xEdges[i-1]
-                tmp.append(xEdges[i]-0.5*width)
-            tmp.append(xEdges[-1]+0.5*width)
-            xEdges = tmp
-
-        if yEdgeLoc == "mid":
-            tmp = []
-            width = yEdges[1]-yEdges[0]
-            tmp.append(yEdges[0]-0.5*width)
-            for i in range(1, len(yEdges)):
-                width = yEdges[i]-yEdges[i-1]
-                tmp.append(yEdges[i]-0.5*width)
-            tmp.append(yEdges[-1]+0.5*width)
-            yEdges = tmp
+        xEdges = _prep_edges(xEdges, len(data), xEdgeLoc)
+        yEdges = _prep_edges(yEdges, len(data[0]), yEdgeLoc)
 
         # Set Mid point values
-        for i in range(1, len(xEdges)):
-            self.midPtX = (xEdges[i] - xEdges[i-1])/2.
-        for i in range(1, len(yEdges)):
-            self.midPtY = (yEdges[i] - yEdges[i-1])/2.
+        self.midPtX = 0.5*(xEdges[:-1]+xEdges[1:])
+        self.midPtY = 0.5*(yEdges[:-1]+yEdges[1:])
 
         # Build histogram data
-        self.data = data
-        self.midPtData = data
+        # Store the data as one contiguous block for the mesh and the
+        # reductions in plot2D
+        dtype = np.float32 if getattr(data, 'dtype', None) == np.float32 \
+                else np.float64
+        self.data = np.ascontiguousarray(data, dtype=dtype)
+        self.midPtData = self.data
         self.xEdges = xEdges
         self.yEdges = yEdges
 
+    def fill_from_samples(self, x, y, xMin, xMax, yMin, yMax, nX, nY,
+                          name=''):
+        """!
+        Builds a histogram object by counting (x, y) samples into uniform
+        bins.  Samples outside of [xMin, xMax] or [yMin, yMax] are ignored.
+        The uncertainty is the Poisson counting error.
+
+        @param self: <em> histogram pointer </em> \n
+            The histogram pointer. \n
+        @param x: <em> list or array of floats </em> \n
+            The x value of each sample. \n
+        @param y: <em> list or array of floats </em> \n
+            The y value of each sample. \n
+        @param xMin: <em> integer or float </em> \n
+            The lower edge of the first x bin. \n
+        @param xMax: <em> integer or float </em> \n
+            The upper edge of the last x bin. \n
+        @param yMin: <em> integer or float </em> \n
+            The lower edge of the first y bin. \n
+        @param yMax: <em> integer or float </em> \n
+            The upper edge of the last y bin. \n
+        @param nX: \e integer \n
+            The number of x bins. \n
+        @param nY: \e integer \n
+            The number of y bins. \n
+        @param name: \e string \n
+            An identifier for the histogram. \n
+        """
+
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        keep = _in_range(x, xMin, xMax) & _in_range(y, yMin, yMax)
+
+        xEdges = np.linspace(xMin, xMax, nX+1)
+        yEdges = np.linspace(yMin, yMax, nY+1)
+        ix = _uniform_index(x[keep], xEdges)
+        iy = _uniform_index(y[keep], yEdges)
+        counts = np.bincount(ix*nY+iy, minlength=nX*nY).reshape(nX, nY)
+
+        self.build_2dHisto(xEdges, yEdges, counts.astype(np.float64),
+                           uncert=np.sqrt(counts), name=name)
+
     def plot2D(self, **kwargs):
         """!
         Plots a 2D histogram.
@@ -559,8 +690,19 @@ class Histogram2D(Histogram):
         @param zIntervals: <em> kwargs integer or float </em> \n
             An optional specification for the number of intervals to be
             used for the Z axis colorscale. \n
+        @param ax: <em> kwargs Axes </em> \n
+            An optional existing axes to draw into instead of creating a new
+            figure.  The figure is then not shown so that the caller can
+            draw many histograms before displaying them. \n
+        @param cax: <em> kwargs Axes </em> \n
+            An optional existing axes for the colorbar when ax is given.  By
+            default space for the colorbar is taken from ax. \n
         """
 
+        import matplotlib.pyplot as plt
+        from matplotlib.colors import LogNorm, Normalize
+        from matplotlib.ticker import FuncFormatter
+
         # Set defaults if not specified since 2.7 sucks
         if 'logX' not in kwargs.keys():
             kwargs['logX'] = False
@@ -577,24 +719,31 @@ class Histogram2D(Histogram):
         if 'savePath' not in kwargs.keys():
             kwargs['savePath'] = ''
         if 'xMin' not in kwargs.keys():
-            kwargs['xMin'] = min(self.xEdges)
+            kwargs['xMin'] = np.min(self.xEdges)
         if 'xMax' not in kwargs.keys():
-            kwargs['xMax'] = max(self.xEdges)
+            kwargs['xMax'] = np.max(self.xEdges)
         if 'yMin' not in kwargs.keys():
-            kwargs['yMin'] = min(self.yEdges)
+            kwargs['yMin'] = np.min(self.yEdges)
         if 'yMax' not in kwargs.keys():
-            kwargs['yMax'] = max(self.yEdges)
+            kwargs['yMax'] = np.max(self.yEdges)
         if 'zMin' not in kwargs.keys():
             kwargs['zMin'] = 1E-6
         if 'zMax' not in kwargs.keys():
             kwargs['zMax'] = np.max(self.data)
         if 'zIntervals' not in kwargs.keys():
             kwargs['zIntervals'] = 8
-
-        # Set up figure
-        fig = plt.figure(figsize=(11, 8))
-        ax1 = fig.add_axes([0.1, 0.1, 0.7, 0.85])
-        axcolor = fig.add_axes([0.85, 0.15, 0.05, 0.70])
+        ax1 = kwargs.pop('ax', None)
+        axcolor = kwargs.pop('cax', None)
+
+        # Set up figure, reusing the caller's axes if given
+        if ax1 is None:
+            fig = plt.figure(figsize=(11, 8))
+            ax1 = fig.add_axes([0.1, 0.1, 0.7, 0.85])
+            axcolor = fig.add_axes([0.85, 0.15, 0.05, 0.70])
+            show = True
+        else:
+            fig = ax1.figure
+            show = False
         ax1.set_title('{}'.format(kwargs['title']), fontsize=30, weight="bold")
         ax1.set_xlabel('{}'.format(kwargs['xLabel']), fontsize=22,
                        weight='bold')
@@ -609,19 +758,251 @@ class Histogram2D(Histogram):
             ax1.set_xscale('log')
         if kwargs['logY']:
             ax1.set_yscale('log')
+        t = _z_ticks(kwargs['zMin'], kwargs['zMax'], kwargs['zIntervals'],
+                     kwargs['logZ'])
+
+        # The mesh is drawn on the bin edges, so non-uniform bins keep their
+        # true extent.  The data is indexed [x][y] while the mesh takes rows
+        # of constant y, hence the transpose.
         if kwargs['logZ']:
-            t = np.logspace(np.floor(np.log10(np.abs(kwargs['zMin']))),
-                            np.floor(np.log10(np.abs(kwargs['zMax']))),
-                            kwargs['zIntervals'])
+            # Draw the cached log10 image with a linear norm so that the log is
+            # not recomputed for every cell on each draw.  Empty bins are
+            # masked and left blank, as LogNorm does.
+            im = ax1.pcolormesh(self.xEdges, self.yEdges,
+                                self._log_image().T,
+                                shading='flat',
+                                norm=Normalize(vmin=log10(kwargs['zMin']),
+                                               vmax=log10(kwargs['zMax'])))
+            fig.colorbar(im, cax=axcolor, ax=ax1, ticks=np.log10(t),
+                         format=FuncFormatter(lambda z, pos:
+                                              '$%.2e$' % 10**z))
         else:
-            t = np.linspace(kwargs['zMin'], kwargs['zMax'],
-                            kwargs['zIntervals'])
-
-        im = ax1.imshow(self.data, interpolation='none', origin='lower',
-                      extent=scale, norm=LogNorm(vmin=kwargs['zMin'],
-                                                 vmax=kwargs['zMax']))
-        fig.colorbar(im, cax=axcolor, ticks=t, format='$%.2e$')
-        plt.show()
+            im = ax1.pcolormesh(self.xEdges, self.yEdges, self._image().T,
+                                shading='flat',
+                                norm=LogNorm(vmin=kwargs['zMin'],
+                                             vmax=kwargs['zMax']))
+            fig.colorbar(im, cax=axcolor, ax=ax1, ticks=t, format='$%.2e$')
+        if show:
+            plt.show()
 
         if kwargs['savePath'] != '':
             fig.savefig(kwargs['savePath'], bbox_inches='tight')
+
+    def _image(self):
+        """!
+        Returns the data drawn by plot2D.  Large images are handed to the
+        colormap pipeline in single precision to halve the memory traffic.
+
+        @param self: <em> histogram2d pointer </em> \n
+            The histogram2d pointer. \n
+
+        @return <em> 2D array of floats </em>: The image data. \n
+        """
+
+        data = np.asarray(self.data)
+        if data.dtype == np.float64 and data.size > 1<<20:
+            data = data.astype(np.float32)
+
+        return data
+
+    def _log_image(self):
+        """!
+        Returns log10 of the image data with the bins that are not positive
+        masked.  The result is cached until the data is reassigned.
+
+        @param self: <em> histogram2d pointer </em> \n
+            The histogram2d pointer. \n
+
+        @return <em> 2D masked array of floats </em>: The log10 image data. \n
+        """
+
+        cached = self._logData
+        if cached is None or cached[0] is not self.data:
+            logData = np.ma.log10(np.ma.masked_less_equal(self._image(), 0))
+            cached = (self.data, logData)
+            self._logData = cached
+
+        return cached[1]
+
+#------------------------------------------------------------------------------#
+def _count_events(events, edges, chunkSize=1<<20):
+    """!
+    @ingroup Histograms
+
+    Counts events into bins with the same result as np.histogram.  Uniform
+    bins are counted from the scaled offset of each event, corrected against
+    the edges by _uniform_index, which avoids the edge search done by
+    np.histogram.  The events are counted in chunks that are summed, so the
+    temporary index arrays stay small for very large event sets.
+
+    @param events: <em> array of floats </em> \n
+        The value of each event. \n
+    @param edges: <em> array of floats </em> \n
+        All of the bin edges. \n
+    @param chunkSize: \e integer \n
+        The number of events counted at a time. \n
+
+    @return <em> array of integers </em>: The counts in each bin. \n
+    """
+
+    nBins = len(edges)-1
+    widths = np.diff(edges)
+    uniform = np.allclose(widths, widths[0], rtol=1E-9, atol=0)
+
+    counts = np.zeros(nBins, dtype=np.intp)
+    for start in range(0, len(events), chunkSize):
+        chunk = events[start:start+chunkSize]
+        if uniform:
+            chunk = chunk[_in_range(chunk, edges[0], edges[-1])]
+            counts += np.bincount(_uniform_index(chunk, edges),
+                                  minlength=nBins)
+        else:
+            counts += np.histogram(chunk, edges)[0]
+
+    return counts
+
+#------------------------------------------------------------------------------#
+def _in_range(x, lo, hi):
+    """!
+    @ingroup Histograms
+
+    Flags the values that fall inside of a closed bin range.
+
+    @param x: <em> array of floats </em> \n
+        The values to check. \n
+    @param lo: \e float \n
+        The lower edge of the first bin. \n
+    @param hi: \e float \n
+        The upper edge of the last bin. \n
+
+    @return <em> array of booleans </em>: True for values in [lo, hi]. \n
+    """
+
+    return (x >= lo) & (x <= hi)
+
+#------------------------------------------------------------------------------#
+def _uniform_index(x, edges):
+    """!
+    @ingroup Histograms
+
+    Finds the bin of each value for uniform bins from its scaled offset
+    instead of searching the edges.  Rounding can put a value that lies on or
+    next to an edge one bin off, so the index is then checked against the
+    edges themselves and moved, as in np.histogram.  Values at the upper edge
+    are placed in the last bin.
+
+    @param x: <em> array of floats </em> \n
+        The values to bin.  All must be in [edges[0], edges[-1]]. \n
+    @param edges: <em> array of floats </em> \n
+        All of the uniformly spaced bin edges. \n
+
+    @return <em> array of integers </em>: The bin index of each value. \n
+    """
+
+    nBins = len(edges)-1
+    lo = edges[0]
+    index = ((x-lo)*(nBins/float(edges[-1]-lo))).astype(np.intp)
+    np.clip(index, 0, nBins-1, out=index)
+
+    index[x < edges[index]] -= 1
+    index[(x >= edges[index+1]) & (index != nBins-1)] += 1
+
+    return index
+
+#------------------------------------------------------------------------------#
+def _z_ticks(zMin, zMax, zIntervals, logZ):
+    """!
+    @ingroup Histograms
+
+    Calculates the colorbar tick locations for a 2D histogram plot.  The
+    result is cached per set of options and must not be modified by the
+    caller.
+
+    @param zMin: <em> integer or float </em> \n
+        The minimum Z axis value. \n
+    @param zMax: <em> integer or float </em> \n
+        The maximum Z axis value. \n
+    @param zIntervals: \e integer \n
+        The number of ticks. \n
+    @param logZ: \e boolean \n
+        Flag to space the ticks by decade. \n
+
+    @return <em> array of floats </em>: The tick locations. \n
+    """
+
+    key = (zMin, zMax, zIntervals, logZ)
+    ticks = _TICK_CACHE.get(key)
+    if ticks is not None:
+        return ticks
+
+    if logZ:
+        ticks = np.logspace(floor(log10(abs(zMin))), floor(log10(abs(zMax))),
+                            zIntervals)
+    else:
+        ticks = np.linspace(zMin, zMax, zIntervals)
+
+    _TICK_CACHE.put(key, ticks)
+
+    return ticks
+
+#------------------------------------------------------------------------------#
+def _prep_edges(edges, nBins, edgeLoc="low"):
+    """!
+    @ingroup Histograms
+
+    Converts one axis of 2D histogram edges to the full set of bin boundaries.
+
+    @param edges: <em> list or array of floats </em> \n
+        The lower, mid, or upper bin edges. \n
+    @param nBins: \e integer \n
+        The number of bins along the axis. \n
+    @param edgeLoc: \e string \n
+        Indicator for the location of the boundary edges.  Options are "low",
+        "mid", or "up" \n
+
+    @return <em> array of floats </em>: The bin boundaries. \n
+    """
+
+    edges = np.asarray(edges, dtype=np.float64)
+
+    if edgeLoc == "low":
+        if len(edges) == nBins:
+            edges = np.concatenate((edges, [edges[-1]+(edges[-1]-edges[-2])]))
+    if edgeLoc == "up":
+        if len(edges) == nBins:
+            edges = np.concatenate(([0.], edges))
+    if edgeLoc == "mid":
+        # Each interior boundary sits halfway between neighboring mid-points;
+        # the outer boundaries reuse the width of the outermost bins
+        widths = np.diff(edges)
+        if np.allclose(widths, widths[0], rtol=1E-9, atol=0):
+            # Uniform bins skip the temporaries of the general case
+            edges = np.linspace(edges[0]-0.5*widths[0],
+                                edges[-1]+0.5*widths[0], len(edges)+1)
+        else:
+            edges = np.concatenate(([edges[0]-0.5*widths[0]],
+                                    edges[1:]-0.5*widths,
+                                    [edges[-1]+0.5*widths[-1]]))
+
+    return edges
+
+#------------------------------------------------------------------------------#
+def _as_values(data):
+    """!
+    @ingroup Histograms
+
+    Converts an array to a list of values for text output.  Double precision
+    and integer data are converted to Python scalars, which format faster than
+    NumPy scalars and print identically.  Single precision data keep their
+    NumPy scalars so that they print at their own precision.
+
+    @param data: <em> list or array of numbers </em> \n
+        The values to convert. \n
+
+    @return <em> list of numbers </em>: The converted values. \n
+    """
+
+    data = np.asarray(data)
+    if data.dtype.kind == 'f' and data.dtype.itemsize < 8:
+        return list(data)
+    return data.tolist()
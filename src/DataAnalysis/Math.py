@@ -16,6 +16,7 @@ existing libraries.
 
 import numpy as np
 from math import exp
+from scipy.special import expit
 
 #------------------------------------------------------------------------------#
 def gauss(x, amplitude, centroid, width):
@@ -24,8 +25,8 @@ def gauss(x, amplitude, centroid, width):
     Evaluates a gaussian at a given point provided the amplitude, centroid,
     and width.
 
-    @param x: <em> integer or float </em>  \n
-        Point at which to evaluate \n
+    @param x: <em> integer, float, or array of integers or floats </em>  \n
+        Point(s) at which to evaluate \n
     @param amplitude: <em> integer or float </em>  \n
         Amplitude of the peak \n
     @param centroid: <em> integer or float </em>  \n
@@ -35,8 +36,15 @@ def gauss(x, amplitude, centroid, width):
 
     @return \e float: evaluated value at point x \n
     """
-    z = (x-centroid)/(1.0*width)
-    return amplitude*np.exp(-0.5*z**2)
+
+    # Every step reuses the buffer holding the standard score
+    z = _standard_score(x, centroid, width, amplitude)
+    z *= z
+    z *= -0.5
+    np.exp(z, out=z)
+    z *= amplitude
+
+    return z[()]
 
 #------------------------------------------------------------------------------#
 def gaussScalar(x, amplitude, centroid, width):
@@ -57,7 +65,8 @@ def gaussScalar(x, amplitude, centroid, width):
     @return \e float: evaluated value at point x \n
     """
 
-    return amplitude*exp(-0.5*(x-centroid)/(1.0*width)**2)
+    z = (x-centroid)/(1.0*width)
+    return amplitude*exp(-0.5*z*z)
 
 #------------------------------------------------------------------------------#
 def smeared_step(x, centroid, width, amplitude):
@@ -77,8 +86,12 @@ def smeared_step(x, centroid, width, amplitude):
 
     @return \e float: evaluated value at point x \n
     """
-    z = (x-centroid)/(1.0*width)
-    return amplitude/(1+np.exp(z))**2
+
+    z = _logistic(_standard_score(x, centroid, width, amplitude))
+    z *= z
+    z *= amplitude
+
+    return z[()]
 
 #------------------------------------------------------------------------------#
 def left_skew_gauss(x, centroid, width, amplitude, rng):
@@ -100,8 +113,9 @@ def left_skew_gauss(x, centroid, width, amplitude, rng):
 
     @return \e float: evaluated value at point x \n
     """
-    z = (x-centroid)/(1.0*width)
-    return amplitude*(np.exp(rng*z))/(1+np.exp(z))**4
+
+    return _skew_gauss(_standard_score(x, centroid, width, amplitude, rng),
+                       amplitude, rng)
 
 #------------------------------------------------------------------------------#
 def right_skew_gauss(x, centroid, width, amplitude, rng):
@@ -123,8 +137,11 @@ def right_skew_gauss(x, centroid, width, amplitude, rng):
 
     @return \e float: evaluated value at point x \n
     """
-    z = (x-centroid)/(1.0*width)
-    return amplitude*(np.exp(rng*z))/(1+np.exp(-z))**4
+
+    z = _standard_score(x, centroid, width, amplitude, rng)
+    denom = np.negative(z, out=np.empty_like(z))
+
+    return _skew_gauss(z, amplitude, rng, denom)
 
 #------------------------------------------------------------------------------#
 def quadratic(x, quad, linear, offset):
@@ -143,7 +160,23 @@ def quadratic(x, quad, linear, offset):
 
     @return \e float: evaluated value at point x \n
     """
-    return quad*x**2 + linear*x + offset   
+
+    # Horner form.  Numerical arrays are accumulated in place in a single
+    # temporary of the common type of the inputs; anything else, such as
+    # scalars or SymPy symbols, uses plain arithmetic.
+    if isinstance(x, np.ndarray):
+        try:
+            dtype = np.result_type(x, quad, linear, offset)
+        except TypeError:
+            dtype = None
+        if dtype is not None and dtype.kind in 'biufc':
+            result = np.multiply(quad, x, dtype=dtype)
+            result += linear
+            result *= x
+            result += offset
+            return result[()]
+
+    return (quad*x + linear)*x + offset
 
 #------------------------------------------------------------------------------#
 def linear(x, linear, offset):
@@ -178,3 +211,89 @@ def scaled_exponential(x, a, b):
     @return \e float: evaluated value at point x \n
     """
     return a*x**(-b)
+
+#------------------------------------------------------------------------------#
+def _standard_score(x, centroid, width, *params):
+    """!
+    @ingroup DataAnalysis
+    Calculates (x-centroid)/width in a new float array that the calling
+    function can update in place.  The array has the broadcast shape of x,
+    centroid, width, and any other parameters that the caller will apply in
+    place, so array parameters work with a scalar x.  Scalars give a 0-d
+    array; index the final result with [()] to return a scalar again.
+    float32 input stays float32, which roughly halves the cost of the exp
+    based shapes; everything else is computed in float64.
+
+    @param x: <em> integer, float, or array of integers or floats </em>  \n
+        Point(s) at which to evaluate \n
+    @param centroid: <em> integer, float, or array of floats </em>  \n
+        Location of the centroid in the same units as x \n
+    @param width: <em> integer, float, or array of floats </em>  \n
+        Width of the distribution in the same units as x \n
+    @param params: <em> integers, floats, or arrays of floats </em>  \n
+        The other parameters of the calling function. \n
+
+    @return <em> array of floats </em>: The standard score of each point \n
+    """
+
+    dtype = np.float32 if getattr(x, 'dtype', None) == np.float32 \
+            else np.float64
+    z = np.empty(np.broadcast(x, centroid, width, *params).shape,
+                 dtype=dtype)
+    z[...] = x
+    z -= centroid
+    z *= 1.0/width
+
+    return z
+
+#------------------------------------------------------------------------------#
+def _skew_gauss(z, amplitude, rng, denom=None):
+    """!
+    @ingroup DataAnalysis
+    Evaluates amplitude*exp(rng*z)/(1+exp(denom))**4 with only two buffers,
+    both of which are updated in place.  The denominator is taken through
+    _logistic so that large exponents do not overflow.
+
+    @param z: <em> array of floats </em>  \n
+        The standard score of each point.  Overwritten with the result. \n
+    @param amplitude: <em> integer or float </em>  \n
+        Amplitude of the peak \n
+    @param rng: <em> integer or float </em>  \n
+        Range of the distribution in the same units as x \n
+    @param denom: <em> array of floats </em>  \n
+        The exponent in the denominator.  Overwritten.  Defaults to z. \n
+
+    @return <em> float or array of floats </em>: evaluated value at each
+        point \n
+    """
+
+    if denom is None:
+        denom = z.copy()
+    denom = _logistic(denom)
+    denom *= denom
+    denom *= denom
+
+    z *= rng
+    np.exp(z, out=z)
+    z *= amplitude
+    z *= denom
+
+    return z[()]
+
+#------------------------------------------------------------------------------#
+def _logistic(z):
+    """!
+    @ingroup DataAnalysis
+    Calculates 1/(1+exp(z)) in place as expit(-z).  expit does not overflow
+    for large z and keeps its full relative precision in the tail.
+
+    @param z: <em> array of floats </em>  \n
+        The exponent.  Overwritten with the result. \n
+
+    @return <em> array of floats </em>: The logistic function of -z \n
+    """
+
+    np.negative(z, out=z)
+    expit(z, out=z)
+
+    return z
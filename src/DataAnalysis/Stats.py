@@ -16,11 +16,16 @@ existing libraries.
 
 import numpy as np
 
-from sympy import symbols, diff
+from sympy import symbols, diff, lambdify, sympify
 from math import sqrt
 
+# Propagated variance of the curve fit functions used by curve_fit_error4
+# keyed on the symbolic expression of the function
+_VARIANCE_CACHE = {}
+_VARIANCE_CACHE_SIZE = 128
+
 #------------------------------------------------------------------------------#
-def red_chisq(yData, yMod, standDev=[], freeParams=2):
+def red_chisq(yData, yMod, standDev=None, freeParams=2):
     """!
     @ingroup Stats
 
@@ -36,7 +41,8 @@ def red_chisq(yData, yMod, standDev=[], freeParams=2):
     @param yMod: <em> Numpy array of integers or floats </em> \n
         Model data. \n
     @param standDev: <em> Numpy array of integers or floats </em> \n
-        Experimental data 1\f$\sigma\f$ standard deviation. \n
+        Experimental data 1\f$\sigma\f$ standard deviation.  If not given,
+        the residuals are not weighted. \n
     @param freeParams: \e integer \n
         The number of free parameters in the model. \n
 
@@ -44,18 +50,15 @@ def red_chisq(yData, yMod, standDev=[], freeParams=2):
     """
 
     # Enable the use of lists as input
-    if type(yData) == list:
-        yData = np.asarray(yData)
-    if type(yMod) == list:
-        yMod = np.asarray(yMod)
-    if type(standDev) == list:
-        standDev = np.asarray(standDev)
-        
-    # Chi-square statistic
-    if len(standDev) != len(yData):
-        chisq = np.sum((yData-yMod)**2)
-    else:
-        chisq = np.sum(((yData-yMod)/standDev)**2)
+    yData = np.asarray(yData)
+
+    # Chi-square statistic.  The residuals are scaled in place and summed
+    # with a dot product so that only one temporary array is made.
+    resid = np.array(yData, dtype=np.float64).ravel()
+    resid -= np.ravel(yMod)
+    if standDev is not None and len(standDev) == len(yData):
+        resid /= np.ravel(standDev)
+    chisq = np.dot(resid, resid)
 
     # Number of degrees of freedom
     nu = yData.size-freeParams
@@ -87,15 +90,16 @@ def curve_fit_error4(func, args, indyErr, covar):
         all variables.
     @param args: <em> list or array of floats or intergers </em> \n
         Arguments to the curve fit function.  There must be one independent
-        variable and four free parameter variables
+        variable and four free parameter variables.  The independent variable
+        may be an array of points to evaluate the error at all at once. \n
     @param indyErr: <em> float or interger </em> \n
         The error on the independent variable. \n
     @param covar: <em> array of floats or intergers </em> \n
         Covariance of the free parameters used for the fit. Must be 4 x 4
         array \n
 
-    @return \e float: The standard deviation of the curve fit at the point
-                      specified\n
+    @return <em> float or array of floats </em>: The standard deviation of
+        the curve fit at the point or points specified\n
     """
     assert len(args) == 5, "The number of arguments is not the 5 needed for \
                             curve_fit_error4."
@@ -103,47 +107,83 @@ def curve_fit_error4(func, args, indyErr, covar):
                         array is less than the number of free parameters (4)"
     assert hasattr(func, '__call__'), 'Invalid function handle'
 
-    # Assign symbols to each variable
-    x, a, b, c, d = symbols('x a b c d')
+    # Evaluate the propagated variance at every point in one call
+    x = np.asarray(args[0], dtype=np.float64)
+    err = np.sqrt(np.diag(covar))
+    values = [x] + list(args[1:]) + [indyErr] + list(err) \
+             + [covar[0, 1], covar[0, 2], covar[0, 3], covar[1, 2],
+                covar[1, 3], covar[2, 3]]
+    variables, expr, varFunc = _variance(func)
+    try:
+        variance = varFunc(*values)
+    except NameError:
+        # The variance uses a function without a NumPy equivalent, so it is
+        # evaluated symbolically point by point instead
+        point = dict(zip(variables[1:], [sympify(v) for v in values[1:]]))
+        variance = []
+        for xi in x.ravel():
+            point[variables[0]] = sympify(float(xi))
+            variance.append(float(expr.xreplace(point)))
+        variance = np.reshape(variance, x.shape)
+
+    # A variance that does not depend on x is spread over all of the points
+    variance = np.broadcast_to(np.asarray(variance, dtype=np.float64),
+                               x.shape)
+    if x.ndim == 0:
+        return sqrt(variance)
+
+    return np.sqrt(variance)
+
+#------------------------------------------------------------------------------#
+def _variance(func):
+    """!
+    @ingroup Stats
+
+    Returns the variance propagated by curve_fit_error4 for a 4 parameter
+    curve fit function, both symbolically and as a numerical function.  The
+    partial derivatives are taken once per expression of the function and
+    cached.
+
+    @param func: \e function \n
+        The curve fit function.  This must be partially differentiable wrt
+        all variables. \n
+
+    @return <em> tuple </em>: The symbols for x, a, b, c, d, the error on
+        x, the errors on a, b, c, and d, and the ab, ac, ad, bc, bd, and cd
+        covariances; the variance in terms of those symbols; and the variance
+        as a function that takes the same values in the same order. \n
+    """
+
+    # Assign symbols to each variable, error, and covariance
+    params = symbols('x a b c d')
+    errs = symbols('sx sa sb sc sd')
+    covs = symbols('cab cac cad cbc cbd ccd')
+    variables = params + errs + covs
+
+    expr = func(*params)
+    cached = _VARIANCE_CACHE.get(expr)
+    if cached is not None:
+        return cached
 
     # Take partial derivatives wrt each variable to get variance
-    err = np.sqrt(np.diag(covar))
-    variance = 0
-    variance += diff(func(x, a, b, c, d), x).subs({x:args[0], a:args[1], \
-                           b:args[2], c:args[3], d:args[4]})**2*indyErr**2
-    variance += diff(func(x, a, b, c, d), a).subs({x:args[0], a:args[1], \
-                           b:args[2], c:args[3], d:args[4]})**2*err[0]**2
-    variance += diff(func(x, a, b, c, d), b).subs({x:args[0], a:args[1], \
-                           b:args[2], c:args[3], d:args[4]})**2*err[1]**2
-    variance += diff(func(x, a, b, c, d), c).subs({x:args[0], a:args[1], \
-                           b:args[2], c:args[3], d:args[4]})**2*err[2]**2
-    variance += diff(func(x, a, b, c, d), d).subs({x:args[0], a:args[1], \
-                           b:args[2], c:args[3], d:args[4]})**2*err[3]**2
+    derivs = [diff(expr, v) for v in params]
+    variance = sum([(dv*sv)**2 for dv, sv in zip(derivs, errs)])
 
     # Add covariance terms
-    variance += + 2*diff(func(x, a, b, c, d), a).subs({x:args[0], a:args[1], \
-                           b:args[2], c:args[3], d:args[4]}) \
-                   *diff(func(x, a, b, c, d), b).subs({x:args[0], a:args[1], \
-                           b:args[2], c:args[3], d:args[4]})*covar[0, 1]
-    variance += + 2*diff(func(x, a, b, c, d), a).subs({x:args[0], a:args[1], \
-                           b:args[2], c:args[3], d:args[4]}) \
-                   *diff(func(x, a, b, c, d), c).subs({x:args[0], a:args[1], \
-                           b:args[2], c:args[3], d:args[4]})*covar[0, 2]
-    variance += + 2*diff(func(x, a, b, c, d), a).subs({x:args[0], a:args[1], \
-                           b:args[2], c:args[3], d:args[4]}) \
-                   *diff(func(x, a, b, c, d), d).subs({x:args[0], a:args[1], \
-                           b:args[2], c:args[3], d:args[4]})*covar[0, 3]
-    variance += + 2*diff(func(x, a, b, c, d), b).subs({x:args[0], a:args[1], \
-                           b:args[2], c:args[3], d:args[4]}) \
-                   *diff(func(x, a, b, c, d), c).subs({x:args[0], a:args[1], \
-                           b:args[2], c:args[3], d:args[4]})*covar[1, 2]
-    variance += + 2*diff(func(x, a, b, c, d), b).subs({x:args[0], a:args[1], \
-                           b:args[2], c:args[3], d:args[4]}) \
-                   *diff(func(x, a, b, c, d), d).subs({x:args[0], a:args[1], \
-                           b:args[2], c:args[3], d:args[4]})*covar[1, 3]
-    variance += + 2*diff(func(x, a, b, c, d), c).subs({x:args[0], a:args[1], \
-                           b:args[2], c:args[3], d:args[4]}) \
-                   *diff(func(x, a, b, c, d), d).subs({x:args[0], a:args[1], \
-                           b:args[2], c:args[3], d:args[4]})*covar[2, 3]
-
-    return sqrt(variance)
+    pairs = [(1, 2), (1, 3), (1, 4), (2, 3), (2, 4), (3, 4)]
+    variance += 2*sum([derivs[j]*derivs[k]*cv
+                       for (j, k), cv in zip(pairs, covs)])
+
+    # Shared subexpressions of the derivatives are evaluated once where the
+    # SymPy version supports it
+    try:
+        varFunc = lambdify(variables, variance, 'numpy', cse=True)
+    except TypeError:
+        varFunc = lambdify(variables, variance, 'numpy')
+
+    result = (variables, variance, varFunc)
+    if len(_VARIANCE_CACHE) >= _VARIANCE_CACHE_SIZE:
+        _VARIANCE_CACHE.clear()
+    _VARIANCE_CACHE[expr] = result
+
+    return result
@@ -0,0 +1,119 @@
+"""!
+This test suite evaluates all of the corner and edge cases for the functions
+and classes in Histograms.
+
+@author James Bevins
+
+@date 17Jul17
+"""
+
+import os
+import tempfile
+
+import numpy as np
+
+from Histograms import Histogram, Histogram2D
+
+import nose
+from nose.plugins.skip import SkipTest
+from nose.tools import assert_equal, assert_not_equal, assert_raises, raises, \
+    assert_almost_equal, assert_true, assert_false, assert_in
+
+#------------------------------------------------------------------------------#
+def test_build_from_events():
+    """!
+    1) Test events on the bin edges against np.histogram.
+    2) Test a number of bins and a range against np.histogram.
+    3) Test non-uniform edges against np.histogram.
+    """
+
+    #1
+    edges = np.linspace(0, 1, 11)
+    events = np.append(edges, [0., 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8,
+                               0.9, 1.])
+    hist = Histogram()
+    hist.build_from_events(events, edges)
+    assert_equal(list(hist.midPtData), list(np.histogram(events, edges)[0]))
+
+    #2
+    rng = np.random.RandomState(42)
+    events = np.append(rng.uniform(-1, 4, 10000), edges)
+    hist.build_from_events(events, 13, binRange=(-0.7, 3.1))
+    assert_equal(list(hist.midPtData),
+                 list(np.histogram(events, 13, range=(-0.7, 3.1))[0]))
+
+    #3
+    edges = [0., 0.1, 0.3, 0.7, 1.5]
+    hist.build_from_events(events, edges)
+    assert_equal(list(hist.midPtData), list(np.histogram(events, edges)[0]))
+
+#------------------------------------------------------------------------------#
+def test_accumulate():
+    """!
+    1) Test chunks of events, some on the bin edges, against np.histogram of
+       all of the events.
+    2) Test that the uncertainty is the Poisson error of the total counts.
+    """
+
+    #1
+    edges = np.linspace(0, 1, 11)
+    rng = np.random.RandomState(42)
+    chunks = [[0., 0.1, 0.2, 0.3, 0.4, 0.5], rng.uniform(-0.5, 1.5, 5000),
+              [0.6, 0.7, 0.8, 0.9, 1.], edges]
+    hist = Histogram()
+    hist.build_from_events(chunks[0], edges)
+    for chunk in chunks[1:]:
+        hist.accumulate(chunk)
+    counts = np.histogram(np.concatenate(chunks), edges)[0]
+    assert_equal(list(hist.midPtData), list(counts))
+
+    #2
+    assert_true(np.allclose(hist.sigma, np.sqrt(counts)))
+
+#------------------------------------------------------------------------------#
+def test_fill_from_samples():
+    """!
+    1) Test samples on the bin edges against np.histogram2d.
+    2) Test random samples, some out of range, against np.histogram2d.
+    """
+
+    #1
+    edges = np.linspace(0, 1, 11)
+    values = np.array([0., 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.])
+    x, y = [a.ravel() for a in np.meshgrid(np.append(edges, values),
+                                           np.append(edges, values))]
+    hist = Histogram2D()
+    hist.fill_from_samples(x, y, 0, 1, 0, 1, 10, 10)
+    assert_true(np.array_equal(hist.data,
+                               np.histogram2d(x, y, [edges, edges])[0]))
+
+    #2
+    rng = np.random.RandomState(42)
+    x = rng.uniform(-2.5, 3.5, 10000)
+    y = rng.uniform(-1.5, 6.5, 10000)
+    xEdges = np.linspace(-2.1, 3.3, 28)
+    yEdges = np.linspace(-1.2, 6.3, 16)
+    hist.fill_from_samples(x, y, -2.1, 3.3, -1.2, 6.3, 27, 15)
+    assert_true(np.array_equal(hist.data,
+                               np.histogram2d(x, y, [xEdges, yEdges])[0]))
+
+#------------------------------------------------------------------------------#
+def test_write():
+    """!
+    1) Test that integer data are written as integers at the midpoints.
+    2) Test that every edge is written with the uncertainty of its bin.
+    """
+
+    hist = Histogram()
+    hist.build_histo([0, 1, 2], [5, 7], uncert=[2, 3])
+    path = os.path.join(tempfile.mkdtemp(), 'hist')
+
+    #1
+    hist.write(path)
+    with open("{}.txt".format(path)) as f:
+        assert_equal(f.read(), "0.5 5\n1.5 7\n")
+
+    #2
+    hist.write(path, includeUncert=True, edge=True)
+    with open("{}.txt".format(path)) as f:
+        assert_equal(f.read(), "0.0 5 2\n1.0 5 2\n1.0 7 3\n2.0 7 3\n")
@@ -13,8 +13,10 @@ import pandas as pd
 import numpy as np
 
 from datetime import datetime
+from sympy import symbols, expand
 
-from Math import gauss, smeared_step, skew_gauss, quadratic
+from Math import gauss, smeared_step, left_skew_gauss, right_skew_gauss, \
+                 quadratic
 
 import nose
 from nose.plugins.skip import SkipTest
@@ -47,6 +49,31 @@ def test_gauss():
     assert_raises(TypeError, gauss, 99, 1000, "ten", 2)
     assert_raises(ValueError, gauss, 99, 1000, 100, "two")
 
+#------------------------------------------------------------------------------#
+def test_array_parameters():
+    """!
+    1) Test gauss with an array parameter and a scalar x.
+    2) Test the other peak shapes with array parameters and a scalar x
+       against their closed-form expressions.
+    3) Test an array x broadcast against an array parameter.
+    """
+
+    #1
+    assert_equal(list(gauss(1.0, np.array([1., 2.]), 1.0, 1.0)), [1., 2.])
+
+    #2
+    z = np.array([-1., 1.])
+    assert_true(np.allclose(smeared_step(1., np.array([2., 0.]), 1, 2),
+                            2/(1+np.exp(z))**2))
+    assert_true(np.allclose(left_skew_gauss(1., 0, 1, 1, np.array([1., 2.])),
+                            np.exp([1., 2.])/(1+np.exp(1.))**4))
+    assert_true(np.allclose(right_skew_gauss(1., np.array([2., 0.]), 1, 1, 1),
+                            np.exp(z)/(1+np.exp(-z))**4))
+
+    #3
+    assert_equal(gauss(np.array([1., 2.]), 1, np.array([[1.], [2.]]),
+                       1).shape, (2, 2))
+
 #------------------------------------------------------------------------------#
 def test_smeared_step():
     """!
@@ -73,6 +100,33 @@ def test_smeared_step():
     assert_raises(TypeError, smeared_step, 99, "ten", 1000, 2)
     assert_raises(TypeError, smeared_step, 99, 1000, 100, "two")
 
+#------------------------------------------------------------------------------#
+def test_logistic_tail():
+    """!
+    1) Test tail values of smeared_step against amplitude/(1+exp(z))**2.
+    2) Test a float32 tail value of smeared_step.
+    3) Test tail values of the skewed gaussians against
+       amplitude*exp(rng*z)/(1+exp(+-z))**4.
+    """
+
+    #1
+    for z in [30., 40., 100.]:
+        expected = 1/(1+np.exp(z))**2
+        assert_almost_equal(smeared_step(z, 0, 1, 1)/expected, 1, places=12)
+
+    #2
+    expected = 1/(1+np.exp(15.))**2
+    assert_almost_equal(smeared_step(np.float32(15), 0, 1, 1)/expected, 1,
+                        places=5)
+
+    #3
+    for z in [30., 40.]:
+        expected = np.exp(z)/(1+np.exp(z))**4
+        assert_almost_equal(left_skew_gauss(z, 0, 1, 1, 1)/expected, 1,
+                            places=12)
+        assert_almost_equal(right_skew_gauss(-z, 0, 1, 1, -1)/expected, 1,
+                            places=12)
+
 #------------------------------------------------------------------------------#
 def test_skew_gauss():
     """!
@@ -84,19 +138,25 @@ def test_skew_gauss():
     """
 
     #1
-    assert_almost_equal(skew_gauss(99, 100, 2, 1000, 5), 12.3228, places=4)
-    assert_almost_equal(skew_gauss(99., 100., 2., 1000., 5), 12.3228, places=4)
-    assert_equal(skew_gauss(100, 100, 2, 1000, 5), 62.5)
-    assert_almost_equal(skew_gauss(50, 100, 2, 1000, 5), 5.1664E-50, places=4)
+    assert_almost_equal(left_skew_gauss(99, 100, 2, 1000, 5), 12.3228,
+                        places=4)
+    assert_almost_equal(left_skew_gauss(99., 100., 2., 1000., 5), 12.3228,
+                        places=4)
+    assert_equal(left_skew_gauss(100, 100, 2, 1000, 5), 62.5)
+    assert_almost_equal(left_skew_gauss(50, 100, 2, 1000, 5), 5.1664E-50,
+                        places=4)
 
     #2
-    assert_almost_equal(skew_gauss(-50, 100, 2, 1000, 5), 1.38E-160, places=2)
-    assert_almost_equal(skew_gauss(99, 100, -2, 1000, 5), 247.5091, places=4)
-    assert_almost_equal(skew_gauss(99, 100, 2, -1000, 5), -12.3228, places=4)
+    assert_almost_equal(left_skew_gauss(-50, 100, 2, 1000, 5), 1.38E-160,
+                        places=2)
+    assert_almost_equal(left_skew_gauss(99, 100, -2, 1000, 5), 247.5091,
+                        places=4)
+    assert_almost_equal(left_skew_gauss(99, 100, 2, -1000, 5), -12.3228,
+                        places=4)
 
     #3
-    assert_raises(TypeError, skew_gauss, 99, "ten", 1000, 2, 5)
-    assert_raises(TypeError, skew_gauss, 99, 1000, 100, "two", 5)
+    assert_raises(TypeError, left_skew_gauss, 99, "ten", 1000, 2, 5)
+    assert_raises(TypeError, left_skew_gauss, 99, 1000, 100, "two", 5)
 
 #------------------------------------------------------------------------------#
 def test_quadratic():
@@ -104,6 +164,7 @@ def test_quadratic():
     1) Test values computed by hand.
     2) Test functionality if inputs are negative.
     3) Test exceptions
+    4) Test numerical, object, and SymPy symbol inputs
 
     General: Test that both int and float values work for all inputs
     """
@@ -123,3 +184,12 @@ def test_quadratic():
     #3
     assert_raises(TypeError, quadratic, "ten", 5, 20, 100)
     assert_raises(TypeError, quadratic, 10, "five", 20, -100)
+
+    #4
+    assert_equal(list(quadratic(np.array([10, -10]), 5, 20, 100)), [800, 400])
+    assert_equal(list(quadratic(np.array([10, -10], dtype=object), 5, 20,
+                                100)), [800, 400])
+    x, a, b, c = symbols('x a b c')
+    assert_equal(expand(quadratic(x, a, b, c)), a*x**2 + b*x + c)
+    assert_equal(list(quadratic(np.array([x, 1]), a, b, c)),
+                 [c + x*(a*x + b), a + b + c])
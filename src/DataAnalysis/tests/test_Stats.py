@@ -8,6 +8,7 @@ and classes in Stats.
 """
 
 import numpy as np
+import sympy as sp
 
 from Stats import red_chisq, curve_fit_error4
 
@@ -41,6 +42,8 @@ def test_curve_fit_error4():
     1) Test known case
     2) Test inputs
     3) Test exceptions
+    4) Test a function without a NumPy equivalent
+    5) Test an array of points
     """
 
     #1
@@ -79,3 +82,25 @@ def test_curve_fit_error4():
     assert_raises(AssertionError, curve_fit_error4, test, var, 0.00376353, cov)
     var = np.array([1, -1.83971535e-05, 1.00102485e-01, 7.03187162e-06])
     assert_raises(AssertionError, curve_fit_error4, test, var, 0.00376353, cov)
+
+    #4
+    def test(y, a, b, c, d):
+        return a*sp.Ei(b*y) + c*y + d
+    var = [1, 2, 0.5, 1, 0]
+    cov = np.diag([0.01, 0.01, 0.01, 0.01])
+    assert_almost_equal(curve_fit_error4(test, var, 0.1, cov), \
+                        0.801042055, places=6)
+
+    #5
+    def test(y, a, b, c, d):
+        return -b + (b**2 - 4*c*(a-y))**(1/2.)/(2*c) + d
+    var = [np.array([1, 3]), -1.83971535e-05, 1.00102485e-01, 7.03187162e-06,
+           0.00e+00]
+    cov = np.array([[6.0046261e-10, -1.0757028e-10, 4.0166052e-12, 0.0000e+00],
+                  [-1.07570279e-10, 2.34010372e-11, -9.49970127e-13, 0.0e+00],
+                  [4.01660518e-12, -9.49970127e-13, 4.05090007e-14, 0.000e+00],
+                  [0.00000000e+00, 0.00000000e+00, 0.00000000e+00, 0.0000e+00]])
+    sigma = curve_fit_error4(test, var, 0.0000376353, cov)
+    assert_equal(len(sigma), 2)
+    assert_almost_equal(sigma[0], 204.062627963, places=6)
+    assert_almost_equal(sigma[1], 204.063283413, places=6)
@@ -24,6 +24,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 from math import sqrt
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
 from scipy.optimize import curve_fit
 from matplotlib.ticker import MultipleLocator
 
@@ -140,79 +142,72 @@ class ActivationData(object):
             Keyword arguments for the get_peaks function \n
         """
 
-        # Initialize dataframe
+        # Initialize the rows for this object and each additional object.
+        # The dataframes are built once all files have been read.
         i = 0
-        self.metaData = pd.DataFrame(columns=('Cs137Position', 'liveTime',
-                               'realTime', 'deadTime', 'counts', 'countUncert',
-                               'countRate', 'countRateUncert'))
+        columns = ('Cs137Position', 'liveTime', 'realTime', 'deadTime',
+                   'counts', 'countUncert', 'countRate', 'countRateUncert',
+                   'line')
+        index = [[] for k in range(len(args)+1)]
+        rows = [[] for k in range(len(args)+1)]
+
+        # Read the spectra in parallel threads since parse_spe is dominated
+        # by file I/O.  The peaks are then fit in file name order.
+        files = sorted([f for f in os.listdir(path) if f.endswith(".Spe")])
+        pool = ThreadPool(max(1, min(len(files), cpu_count())))
+        try:
+            spectra = pool.map(parse_spe, [path+f for f in files])
+        finally:
+            pool.close()
+
+        # Store the raw spectra in one step, aligned to the channels of the
+        # first file
+        names = [os.path.splitext(f)[0].split('_')[3] for f in files]
+        if files:
+            self.rawData = pd.concat([spectrum[6]['counts']
+                                      for spectrum in spectra],
+                                     axis=1, keys=names)\
+                             .reindex(spectra[0][6].index)
 
         # Loop over all files
-        for filename in os.listdir(path):
-            if filename.endswith(".Spe"):
-                name = os.path.splitext(filename)[0].split('_')[3]
-
-                # Read data from this file and store the raw results
-                print "Processing:", filename
-                (realTime, liveTime, measDate, a, b, c, rawdf) =\
-                                                    parse_spe(path+filename)
-                if i == 0:
-                    self.rawData = rawdf
-                    self.rawData.columns = [name]
-                else:
-                    self.rawData.loc[:, name] = rawdf['counts']
-
-                # Store energy calibrations
-                if self.eCalibParams == []:
-                    self.eCalibParams = [a, b, c]
-                elif self.eCalibParams != [a, b, c]:
-                    print "WARNING: Energy calibration parameters are ",\
-                          "shifting in the pileup correction data."
-
-                (channels, counts, energy, peaks, windows) = self.get_peaks(
-                                                           col=name,
-                                                           cutCh=cutCh,
-                                                           **kwargs)
-
-                def set_data(df):
-                    """!
-                    Internal private function for read_pileup_data to set
-                    each ofthe cells in the data frame.
-
-                    @param df \n
-                        An Activation Data object to store the information
-                        in. \n
-                    """
-                    df.at[i, 'Cs137Position'] = os.path.splitext(filename)\
-                                                          [0].split('_')[3]
-                    df.at[i, 'line'] = energy[pk]
-                    df.at[i, 'realTime'], df.at[i, 'liveTime'] = realTime,\
-                                                                 liveTime
-                    df.at[i, 'deadTime'] = (realTime-liveTime)/realTime*100
-                    pkChannels = channels[windows[pk][0]:windows[pk][1]]
-                    pkCounts = counts[windows[pk][0]:windows[pk][1]]
-                    (df.at[i, 'counts'], df.at[i, 'countUncert'], redChiSq)\
-                                          = ge_peakfit(pkChannels, pkCounts)
-                    df.at[i, 'countRate'] = df.at[i, 'counts']\
-                                           /df.at[i, 'liveTime']
-                    df.at[i, 'countRateUncert'] = sqrt((df.at[i, 'countUncert']\
-                                                /df.at[i, 'counts'])**2 \
-                                                +(0.5/df.at[i, 'liveTime'])**2)\
-                                                *df.at[i, 'countRate']
-
-                # Store each peak in its own dataframe
-                for j in range(0, len(peaks)):
-                    pk = peaks[j]
-                    if j == 0:
-                        set_data(self.metaData)
-                    elif j <= len(args):
-                        set_data(args[j-1].metaData)
-                i += 1
-
-        # Store data as floats
-        for col in ['liveTime', 'realTime', 'deadTime', 'counts', 'countUncert',
-                    'countRate', 'countRateUncert']:
-            self.col_to_float('metaData', col)
-        self.metaData=self.metaData.sort_values(by='deadTime')
+        for filename, name, spectrum in zip(files, names, spectra):
+            print "Processing:", filename
+            (realTime, liveTime, measDate, a, b, c, rawdf) = spectrum
+
+            # Store energy calibrations
+            if self.eCalibParams == []:
+                self.eCalibParams = [a, b, c]
+            elif self.eCalibParams != [a, b, c]:
+                print "WARNING: Energy calibration parameters are ",\
+                      "shifting in the pileup correction data."
+
+            (channels, counts, energy, peaks, windows) = self.get_peaks(
+                                                       col=name,
+                                                       cutCh=cutCh,
+                                                       **kwargs)
+
+            # Store each peak in its own dataframe
+            for j in range(0, min(len(peaks), len(args)+1)):
+                pk = peaks[j]
+                index[j].append(i)
+                rows[j].append(_pileup_row(
+                                   name, realTime, liveTime, energy[pk],
+                                   channels[windows[pk][0]:windows[pk][1]],
+                                   counts[windows[pk][0]:windows[pk][1]]))
+            i += 1
+
+        # Build each dataframe in one step with float columns so that the
+        # sort on dead time compares floats.  The stable sort keeps equal
+        # dead times in file order.
+        dtypes = dict([(col, np.float64) for col in columns
+                       if col != 'Cs137Position'])
+        for k in range(len(args)):
+            args[k].metaData = pd.DataFrame(rows[k+1], index=index[k+1],
+                                            columns=columns).astype(dtypes)
+        self.metaData = pd.DataFrame(rows[0], index=index[0],
+                                     columns=columns).astype(dtypes)
+        self.metaData = self.metaData.sort_values(by='deadTime',
+                                                  kind='mergesort')
 
     def get_peaks(self, col, cutCh=0, threshold=0.5, minDist=10):
         """!
@@ -241,10 +236,11 @@ class ActivationData(object):
             each peak. \n
         """
 
-        channels = np.asarray(self.rawData[col].index[cutCh:])
-        counts = np.asarray(self.rawData[col][cutCh:])
-        energy = self.eCalibParams[2]+self.eCalibParams[1]*channels\
-                 +self.eCalibParams[0]*channels**2
+        series = self.rawData[col]
+        channels = np.asarray(series.index)[cutCh:]
+        counts = np.asarray(series)[cutCh:]
+        # The calibration is stored highest order first as polyval expects
+        energy = np.polyval(self.eCalibParams, channels)
         peaks = peakutils.indexes(counts, thres=threshold, min_dist=minDist)
         windows = get_peak_windows(peaks)
 
@@ -365,10 +361,10 @@ class ActivationData(object):
         ax1 = fig.add_axes([0.1, 0.1, 0.8, 0.85])
 
         # Set axes
-        ax1.axis([0.9*min(getattr(self, kwargs['dataSet'])[xName]),
-                  1.1*max(getattr(self, kwargs['dataSet'])[xName]),
-                  0.9*min(getattr(self, kwargs['dataSet'])[yName]),
-                  1.1*max(getattr(self, kwargs['dataSet'])[yName])])
+        xData = np.asarray(getattr(self, kwargs['dataSet'])[xName])
+        yData = np.asarray(getattr(self, kwargs['dataSet'])[yName])
+        ax1.axis([0.9*xData.min(), 1.1*xData.max(), 0.9*yData.min(),
+                  1.1*yData.max()])
         if kwargs['logX']:
             ax1.set_xscale('log')
         if kwargs['logY']:
@@ -401,12 +397,19 @@ class ActivationData(object):
             @param sig: \e string \n
                Name of the uncertainty column. \n
             """
+            xData = np.asarray(df[x])
+            yData = np.asarray(df[y])
             if sig != '':
-                plt.errorbar(df[x], df[y], yerr=df[sig], label=label, fmt='o')
+                plt.errorbar(xData, yData, yerr=np.asarray(df[sig]),
+                             label=label, fmt='o')
             else:
-                plt.errorbar(df[x], df[y], label=label, fmt='o')
-            xFit = np.arange(0.01,1.1*max(df[x]), 0.01)
-            yFit = map(lambda y: func(y, *self.fitParams), xFit)
+                plt.errorbar(xData, yData, label=label, fmt='o')
+            xFit = np.arange(0.01, 1.1*xData.max(), 0.01)
+            try:
+                yFit = func(xFit, *self.fitParams)
+            except TypeError:
+                # The function only accepts scalars, so evaluate each point
+                yFit = [func(xf, *self.fitParams) for xf in xFit]
             plt.plot(xFit, yFit)
 
         # Plot all specified datasets
@@ -422,4 +425,40 @@ class ActivationData(object):
                    framealpha=0.5, numpoints=1)
 
         plt.show()
+
 #------------------------------------------------------------------------------#
+def _pileup_row(name, realTime, liveTime, line, pkChannels, pkCounts):
+    """!
+    @ingroup ActivationAnalysis
+    Fits one peak of a pileup spectrum and returns its metadata as a row for
+    read_pileup_data.
+
+    @param name: \e string \n
+        The Cs137 position of the measurement. \n
+    @param realTime: \e float \n
+        The real counting time. \n
+    @param liveTime: \e float \n
+        The live counting time. \n
+    @param line: \e float \n
+        The energy of the peak. \n
+    @param pkChannels: <em> array of integers </em> \n
+        The channels in the peak window. \n
+    @param pkCounts: <em> array of integers </em> \n
+        The counts in the peak window. \n
+
+    @return \e dictionary: The metadata values keyed on column name. \n
+    """
+
+    (pkArea, pkUncert, redChiSq) = ge_peakfit(pkChannels, pkCounts)
+    countRate = pkArea/liveTime
+
+    return {'Cs137Position': name,
+            'line': line,
+            'realTime': realTime,
+            'liveTime': liveTime,
+            'deadTime': (realTime-liveTime)/realTime*100,
+            'counts': pkArea,
+            'countUncert': pkUncert,
+            'countRate': countRate,
+            'countRateUncert': sqrt((pkUncert/pkArea)**2+(0.5/liveTime)**2)
+                               *countRate}
@@ -63,11 +63,11 @@ def read_tally(path, tallyNum, readGroups=True, splitTally=False):
     # Initialize data structures
     tally = False
     colNames = ['bin', 'tally', 'uncertainty']
-    if readGroups == True and splitTally == False:
-        df = pd.DataFrame(columns=colNames)
-    elif readGroups == True and splitTally == True:
+    if readGroups == True and splitTally == True:
         tallyDict = {}
-        df = pd.DataFrame(columns=colNames)
+    # The group-wise results are collected in lists and converted to a
+    # dataframe once the (sub) tally is complete
+    bins, tallies, uncerts = [], [], []
 
     # Determine number of header lines for tally
     if tallyNum[-1] == '1':
@@ -77,69 +77,76 @@ def read_tally(path, tallyNum, readGroups=True, splitTally=False):
     if tallyNum[-1] == '8':
         headerLines = 6
 
-    # Create and open input file
+    # Read the whole output file at once and scan it line by line
     try:
         with open(path, "r") as f:
-
-            # Read the output file line by line
-            for line in f:
-
-                # Find key word for start of flux array
-                splitList = line.strip().split()
-                if len(splitList) >= 3:
-                    if splitList[0].strip() == "1tally" and \
-                          splitList[1].strip() == tallyNum and \
-                          splitList[2].strip() == "nps":
-                        tally = True
-
-                        # Skip header lines
-                        for i in range(0, headerLines):
-                            line = f.next().strip()
+            lines = f.read().split('\n')
+
+        n = 0
+        while n < len(lines):
+
+            # Find key word for start of flux array
+            splitList = lines[n].strip().split()
+            if len(splitList) >= 3:
+                if splitList[0].strip() == "1tally" and \
+                      splitList[1].strip() == tallyNum and \
+                      splitList[2].strip() == "nps":
+                    tally = True
+
+                    # Skip header lines
+                    n += headerLines
+                    line = lines[n].strip()
+                    if readGroups == True and splitTally == True:
+                        subTallyName = line
+                        n += 1
+                    n += 1
+                    splitList = lines[n].split()
+
+            # Fill data structure
+            if tally == True:
+                # If blank line, skip
+                if len(splitList) != 0:
+                    # If end of tally found, consolidate gains
+                    if splitList[0].strip() == "total":
                         if readGroups == True and splitTally == True:
-                            subTallyName = line
-                            line = f.next().strip()
-                        splitList = f.next().split()
-
-                # Fill data structure
-                if tally == True:
-                    # If blank line, skip
-                    if len(splitList) != 0:
-                        # If end of tally found, consolidate gains
-                        if splitList[0].strip() == "total":
-                            if readGroups == True and splitTally == True:
-                                tallyDict[len(tallyDict)] = (subTallyName, df,
-                                                           float(splitList[1]),
-                                                           float(splitList[2]))
-                                df = pd.DataFrame(columns=colNames)
-                                for i in range(0, 3):
-                                    splitList = f.next().split()
-                                if splitList[0][0:4].strip() == '====':
-                                    return tallyDict
-                                else:
-                                    subTallyName = " ".join(splitList)
-                                    splitList = f.next().split()
-
+                            df = pd.DataFrame({'bin': bins,
+                                               'tally': tallies,
+                                               'uncertainty': uncerts},
+                                              columns=colNames)
+                            tallyDict[len(tallyDict)] = (subTallyName, df,
+                                                       float(splitList[1]),
+                                                       float(splitList[2]))
+                            bins, tallies, uncerts = [], [], []
+                            n += 3
+                            splitList = lines[n].split()
+                            if splitList[0][0:4].strip() == '====':
+                                return tallyDict
                             else:
-                                total = splitList[1]
-                                uncert = splitList[2]
-                        # Defintely nothing left to gain, return
-                        elif splitList[0][0:4].strip() == '====':
-                            if readGroups == True and splitTally == False:
-                                return df, total, uncert
-                            else:
-                                return total, uncert
-
-                        # Store group-wise results
-                        elif readGroups == True:
-                            df = df.append(pd.Series(
-                                                  [float(splitList[0].strip()),
-                                                   float(splitList[1].strip()),
-                                                   float(splitList[2].strip())],
-                                             index=colNames), ignore_index=True)
-
-        # Close the file
-        f.close()
-        assert f.closed == True, "File ({}) didn't close properly.".format(path)
+                                # The line after the sub-tally name is
+                                # skipped
+                                subTallyName = " ".join(splitList)
+                                n += 1
+
+                        else:
+                            total = splitList[1]
+                            uncert = splitList[2]
+                    # Defintely nothing left to gain, return
+                    elif splitList[0][0:4].strip() == '====':
+                        if readGroups == True and splitTally == False:
+                            df = pd.DataFrame({'bin': bins,
+                                               'tally': tallies,
+                                               'uncertainty': uncerts},
+                                              columns=colNames)
+                            return df, total, uncert
+                        else:
+                            return total, uncert
+
+                    # Store group-wise results
+                    elif readGroups == True:
+                        bins.append(float(splitList[0]))
+                        tallies.append(float(splitList[1]))
+                        uncerts.append(float(splitList[2]))
+            n += 1
 
     except IOError as e:
         print "I/O error({0}): {1}".format(e.errno, e.strerror)
@@ -11,7 +11,14 @@
 @date 22Sep17
 """
 
+import numpy as np
+
 from math import ceil
+
+# Binding energies computed by Atom.calcBE keyed on (z, a).  The allowed z and
+# a values bound the number of entries, so the cache is not cleared.
+_BE_CACHE = {}
+
 #------------------------------------------------------------------------------#
 class Atom(object):
     """!
@@ -108,7 +115,8 @@ class Atom(object):
         """!
         @ingroup NuclearStructure
         Calculates the binding energy given a A and Z of an atom according to
-        Krane Eq 3.28 given by. \n\n
+        Krane Eq 3.28 given by.  The result for each Z and A is cached, so
+        atoms of the same nuclide reuse it. \n\n
 
         Eqn:        \f$ B(Z, A)=a_vA - a_sA^{\frac{2}{3}} - 
                                 a_cZ(Z-1)A^{\frac{-1}{3}} - 
@@ -124,14 +132,22 @@ class Atom(object):
         a_c = 0.72 # MeV
         a_sym = 23.0 # MeV
 
-        if self.a == 1:
-            self.bindingEnergy =  0.0
-            self.bindingEnergyPerA = 0.0 
-        else:
-            self.bindingEnergy =  a_v*self.a - a_s*self.a**(2/3.) - \
-                a_c*self.z*(self.z-1)*self.a**(-1/3.) - \
-                a_sym*(self.a-2*self.z)**2/self.a + self.calcPairing()
-            self.bindingEnergyPerA =  self.bindingEnergy/self.a
+        key = (self.z, self.a)
+        bindingEnergy = _BE_CACHE.get(key)
+        if bindingEnergy is None:
+            if self.a == 1:
+                bindingEnergy = 0.0
+            else:
+                a = float(self.a)
+                z = self.z
+                a23 = a**(2/3.)
+                a_m13 = a**(-1/3.)
+                bindingEnergy = a_v*a - a_s*a23 - a_c*z*(z-1)*a_m13 - \
+                    a_sym*(a-2*z)**2/a + self.calcPairing()
+            _BE_CACHE[key] = bindingEnergy
+
+        self.bindingEnergy = bindingEnergy
+        self.bindingEnergyPerA = bindingEnergy/self.a
 
     def calcPairing(self):
         """!
@@ -155,10 +171,11 @@ class Atom(object):
         # Calculate the pairing correction:
         if self.a%2 == 1:
             return 0.0
-        elif self.z%2 == 1:
-            return -a_p*self.a**(-3/4.)
+        a_m34 = float(self.a)**(-0.75)
+        if self.z%2 == 1:
+            return -a_p*a_m34
         elif self.z%2 == 0:
-            return a_p*self.a**(-3/4.)
+            return a_p*a_m34
         else:
             print "ERROR: Somehow you have specified a noncovered case in \
                    Atom.calcPairing()."
@@ -198,10 +215,12 @@ def calcMinZ(A):
     Eqn:        \f$ Z_min = \frac{[m_n - m(^1H)] + a_cA^{-frac{1}{3}} +
                 4*a_{sym}}{2a_cA^{-frac{1}{3}} + 8A_{sym}A^{-1}}   \f$ \n                   
 
-    @param A: \e integer \n
-        The number of nucleons. \n
+    @param A: <em> integer or array of integers </em> \n
+        The number of nucleons.  An array gives the minimum Z of each mass
+        chain at once. \n
 
-    @return \e integer: The minimum Z of the mass chain. \n
+    @return <em> integer or array of integers </em>: The minimum Z of the
+        mass chain. \n
     """
 
     # Constants
@@ -210,10 +229,13 @@ def calcMinZ(A):
     a_c = 0.72 # MeV
     a_sym = 23.0 # MeV
    
-    # Calculate Min_Z
-    minZ = round(((m_n-m_H1) + a_c*A**(-1/3.) + 4*a_sym)/ \
-             (2*a_c*A**(-1/3.) + 8*a_sym*A**(-1)))
-    if minZ == 0:
-        return 1
+    # Calculate Min_Z for every A at once
+    A = np.asarray(A, dtype=np.float64)
+    cbrtInv = A**(-1/3.)
+    minZ = np.round(((m_n-m_H1) + a_c*cbrtInv + 4*a_sym)/ \
+             (2*a_c*cbrtInv + 8*a_sym/A))
+    minZ = np.maximum(minZ, 1).astype(int)
+    if minZ.ndim == 0:
+        return int(minZ)
     else:
-        return int(minZ)
\ No newline at end of file
+        return minZ
\ No newline at end of file
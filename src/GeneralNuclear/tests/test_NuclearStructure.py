@@ -84,10 +84,14 @@ def test_calcMinZ():
     
     1) Test edge with A=1
     2) Test known interior
+    3) Test an array of mass chains
     """
     
     #1
     assert_equal(calcMinZ(1), 1)
     
     #2
-    assert_equal(calcMinZ(125), 53)
\ No newline at end of file
+    assert_equal(calcMinZ(125), 53)
+    
+    #3
+    assert_equal(list(calcMinZ([1, 125])), [1, 53])
\ No newline at end of file
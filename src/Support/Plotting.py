@@ -11,13 +11,23 @@
 @date 14Jul17
 """
 
+import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 from matplotlib.ticker import MultipleLocator
 from matplotlib import rc,rcParams
 import matplotlib.lines as mlines
 
 from DataAnalysis.Stats import red_chisq
 
+# Default style cycles for plot
+_COLORS = ('k', 'k', 'k', 'k', 'k', 'k')
+_LINEWIDTHS = (2, 4)
+_DASHES = ((10, 0.001), (2, 2, 2, 2), (10, 5, 2, 5), (10, 5, 10, 5),
+           (10, 2, 2, 2, 2, 2), (10, 2, 10, 2, 2, 2, 2, 2))
+_MARKERS = ('o', '^', '+', 's', 'd', '*', '>')
+_LINESTYLES = ('-', ':', '-.', '--', '-', '-')
+
 #------------------------------------------------------------------------------#
 def plot(*args, **kwargs):
     """!
@@ -32,11 +42,15 @@ def plot(*args, **kwargs):
         An optional list of additional plot options.  This is wrapped in
         kwargs because 2.7 doesn't support args and keyword specified
         arguments.  The options are listed as kwargs parameters below. \n
+    @param usetex: <em> kwargs boolean </em> \n
+        Flag to render all text with LaTeX instead of the built in mathtext.
+        By default, LaTeX is not used since it is much slower. \n
     @param includeLines: <em> kwargs boolean </em> \n
         Flag to include lines in the plot. By default, lines are included. \n
     @param includeMarkers: <em> kwargs boolean </em> \n
         Flag to use a markers on the plot. By default, markers are not
-        included. \n
+        included.  Without markers or a legend, all lines are drawn as a
+        single collection, which is much faster for many data sets. \n
     @param logX: <em> kwargs boolean </em> \n
         Flag to use a log scale on the x axis \n
     @param logY: <em> kwargs boolean </em> \n
@@ -92,9 +106,12 @@ def plot(*args, **kwargs):
         Specifies the dashes cycle. \n
     @param marker: <em> kwargs list </em> \n
         Specifies the marker cycle. \n
+
+    @return \e Figure: The MatPlotLib figure. \n
     """
 
     # Set defaults if not specified since 2.7 sucks
+    usetex = kwargs.pop('usetex', False)
     includeLines = kwargs.pop('includeLines', True)
     includeMarkers = kwargs.pop('includeMarkers', True)
     logX = kwargs.pop('logX', False)
@@ -102,8 +119,9 @@ def plot(*args, **kwargs):
     title = kwargs.pop('title', '')
     xLabel = kwargs.pop('xLabel', '')
     yLabel = kwargs.pop('yLabel', '')
-    dataLabel = kwargs.pop('dataLabel', ['Data Set \#{}'.format(i) \
-                                         for i in range(0, len(args))])
+    dataLabel = kwargs.pop('dataLabel',
+                           [('Data Set \#{}' if usetex else 'Data Set #{}')\
+                            .format(i) for i in range(0, len(args))])
     legend = kwargs.pop('legend', True)
     dualHandles = kwargs.pop('dualHandles', False)
     legendLoc = kwargs.pop('legendLoc', 1)
@@ -118,25 +136,25 @@ def plot(*args, **kwargs):
     grid = kwargs.pop('grid', True)
     xMinorTicks = kwargs.pop('xMinorTicks', 0)
     yMinorTicks = kwargs.pop('yMinorTicks', 0)
-    color = kwargs.pop('color', ['k', 'k', 'k', 'k', 'k', 'k'])
-    linewidth = kwargs.pop('linewidth', [2, 4])
-    dashes = kwargs.pop('dashes', [[10, 0.001], [2, 2, 2, 2], [10, 5, 2, 5],
-                                   [10, 5, 10, 5], [10, 2, 2, 2, 2, 2],
-                                   [10, 2, 10, 2, 2, 2, 2, 2]])
+    color = kwargs.pop('color', _COLORS)
+    linewidth = kwargs.pop('linewidth', _LINEWIDTHS)
+    dashes = kwargs.pop('dashes', _DASHES)
     if includeMarkers:
-        marker = kwargs.pop('marker', ['o', '^', '+', 's', 'd', '*', '>'])
+        marker = kwargs.pop('marker', _MARKERS)
     else:
-        marker = [None]
+        marker = (None,)
     if includeLines:
-        linestyle = kwargs.pop('linestyle', ['-', ':', '-.', '--', '-', '-'])
+        linestyle = kwargs.pop('linestyle', _LINESTYLES)
     else:
-        linestyle = ['None']
+        linestyle = ('None',)
 
-    # Allow use of Tex sybols
-    plt.rc('text', usetex=True)
+    # Tex symbols in $...$ are rendered with mathtext unless a full LaTeX
+    # run is requested, which adds seconds to every figure
+    plt.rc('text', usetex=usetex)
     plt.rc('axes', linewidth=1.5)
     plt.rc('font', weight='bold')
-    rcParams['text.latex.preamble'] = [r'\boldmath']
+    if usetex:
+        rcParams['text.latex.preamble'] = [r'\boldmath']
 
     # Set up figure
     fig = plt.figure(figsize=figsize)
@@ -171,6 +189,12 @@ def plot(*args, **kwargs):
         ax1.yaxis.grid(b=True, which='both', color='0.2', linestyle='-',
                        alpha=0.5)
 
+    # Lines without markers or legend entries need no artist of their own and
+    # are drawn together as one LineCollection
+    batchLines = includeLines and not includeMarkers and not legend
+    segments = []
+    segmentStyles = []
+
     # Add datasets to plot
     n = 0
     m = 0
@@ -189,6 +213,11 @@ def plot(*args, **kwargs):
                              marker=marker[n%len(marker)],  capsize=4, 
                              capthick=1.5, label=dataLabel[n],
                              color=color[n%len(color)])
+        elif batchLines:
+            segments.append(np.column_stack((arg[0], arg[1])))
+            segmentStyles.append((color[n%len(color)],
+                                  linewidth[n//len(linestyle)],
+                                  (0, dashes[n%len(dashes)])))
         elif includeLines:
             if n >= len(dataLabel):
                 ax1.plot(arg[0], arg[1], linewidth=linewidth[n//len(linestyle)],
@@ -213,6 +242,11 @@ def plot(*args, **kwargs):
                          linestyle=linestyle[n%len(linestyle)], marker=marker[n%len(marker)],
                          label=dataLabel[n])
         n += 1
+    if segments:
+        colors, widths, styles = zip(*segmentStyles)
+        ax1.add_collection(LineCollection(segments, colors=colors,
+                                          linewidths=widths,
+                                          linestyles=styles))
 
     # Add and locate legend
     if legend:
@@ -241,6 +275,8 @@ def plot(*args, **kwargs):
             fig.savefig(savePath, bbox_inches='tight', format=saveFormat,
                         dpi=saveDPI)
 
+    return fig
+
 #------------------------------------------------------------------------------#
 def comp_plot(x, dataY, dataUncert, modelY, includeChi2=True,
               freeParams=1, **kwargs):
@@ -269,6 +305,9 @@ def comp_plot(x, dataY, dataUncert, modelY, includeChi2=True,
     @param kwargs: <em> optional plotting inputs </em> \n
         An optional list of additional plot options.The options are
         listed as kwargs parameters below \n
+    @param usetex: <em> kwargs boolean </em> \n
+        Flag to render all text with LaTeX instead of the built in mathtext.
+        By default, LaTeX is not used since it is much slower. \n
     @param logX: <em> kwargs boolean </em> \n
         Flag to use a log scale on the x axis \n
     @param logY: <em> kwargs boolean </em> \n
@@ -344,8 +383,11 @@ def comp_plot(x, dataY, dataUncert, modelY, includeChi2=True,
     if 'yMinorTicks' not in kwargs.keys():
         kwargs['yMinorTicks'] = 0
 
-    # Allow use of Tex sybols
-    plt.rc('text', usetex=True)
+    # Tex symbols in $...$ are rendered with mathtext unless a full LaTeX
+    # run is requested
+    if 'usetex' not in kwargs.keys():
+        kwargs['usetex'] = False
+    plt.rc('text', usetex=kwargs['usetex'])
 
     # Set up figure
     fig = plt.figure(figsize=(9, 6))
@@ -11,63 +11,102 @@
 @date 1May17
 """
 
+import mmap
+
 import numpy as np
 import pandas as pd
 
+from array import array
+from collections import namedtuple
+
+## @var FluxData: \e namedtuple
+# Container for HEPROW flux output holding the lower bin edges, the absolute
+# flux, and its uncertainty as numpy arrays.
+FluxData = namedtuple('FluxData', ['edges', 'flux', 'sigma'])
+
 #------------------------------------------------------------------------------#
-def readGru(path, **kwargs):
+def readGru(path, asArrays=True, **kwargs):
     """!
     @ingroup HEPROW
-    Reads in a HEPROW .gru output file and returns a pandas data frame
-    containing the low bin edges, the absolute flux data, and uncertainty.
+    Reads in a HEPROW .gru output file and returns the low bin edges, the
+    absolute flux data, and uncertainty as numpy arrays or a pandas data frame.
     This does not read the correlation coefficient matrix.
 
     @param path: \e string \n
         Absolute path to the file \n
+    @param asArrays: \e boolean \n
+        Optional specifier to return a FluxData tuple of numpy arrays instead
+        of a pandas data frame. \n
     @param kwargs: \n
         Keyword arguments for pandas.read_table() \n
 
-    @return <em> pandas data frame </em>: A data frame containing the lower
-        bin edges, the absolute flux, and its uncertainty \n
+    @return <em> FluxData or pandas data frame </em>: The lower bin edges,
+        the absolute flux, and its uncertainty \n
     """
 
+    # Find the .gru separator for the flux and correlation matrix in the raw
+    # file so that the correlation matrix is never parsed
+    dataStop = "*********format(16i5)*********"
+    with open(path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            stop = mm.find(dataStop.encode('ascii'))
+            if stop >= 0:
+                kwargs.setdefault('nrows', mm[:stop].count(b'\n'))
+        finally:
+            mm.close()
+
     df = pd.read_table(path, **kwargs)
 
-    # Find the row for he .gru separator for the flux and correlation matrix
-    dataStop = "*********format(16i5)*********"
-    loc = df[df.ix[:, 0] == dataStop].index.tolist()[0]
-    df = df.drop(df.index[loc:])
+    # Drop the separator row if the header offset let it be read
+    loc = df.index[df.iloc[:, 0] == dataStop].tolist()
+    if loc:
+        df = df.drop(df.index[loc[0]:])
+
+    df = df.apply(pd.to_numeric)
+
+    if asArrays:
+        arr = np.asarray(df.values, dtype=float)
+        return FluxData(arr[:, 0], arr[:, 1], arr[:, 2])
 
-    return df.apply(pd.to_numeric)
+    return df
 
 #------------------------------------------------------------------------------#
-def readFlu(path, **kwargs):
+def readFlu(path, asArrays=True, **kwargs):
     """!
     @ingroup HEPROW
-    Reads in a HEPROW .fru output file and returns a pandas data frame
-    containing the low bin edges, the absolute flux data, and uncertainty.
+    Reads in a HEPROW .fru output file and returns the low bin edges, the
+    absolute flux data, and uncertainty as numpy arrays or a pandas data frame.
     This does not read the correlation coefficient matrix.
 
     @param path: \e string \n
         Absolute path to the file \n
+    @param asArrays: \e boolean \n
+        Optional specifier to return a FluxData tuple of numpy arrays instead
+        of a pandas data frame. \n
     @param kwargs: \n
         Keyword arguments for pandas.read_table() \n
 
-    @return <em> pandas data frame </em>: A data frame containing the lower
-        bin edges, the absolute flux, and its uncertainty \n
+    @return <em> FluxData or pandas data frame </em>: The lower bin edges,
+        the absolute flux, and its uncertainty \n
     """
 
     df = pd.read_table(path, **kwargs)
 
-    return df.apply(pd.to_numeric)
+    df = df.apply(pd.to_numeric)
+
+    if asArrays:
+        arr = np.asarray(df.values, dtype=float)
+        return FluxData(arr[:, 0], arr[:, 1], arr[:, 2])
+
+    return df
 
 #------------------------------------------------------------------------------#
 def readMTX(path):
     """!
     @ingroup HEPROW
-    Reads in a HEPROW .MTX covariance output file and returns a the sqrt of the
-    diagonal times the inverse survival function of the \f$\chi^2\f$
-    distribution.
+    Reads in a HEPROW .MTX covariance output file and returns the sqrt of the
+    diagonal. No \f$\chi^2\f$ inverse survival function scaling is applied.
 
     @param path: \e string \n
         Absolute path to the file \n
@@ -76,32 +115,23 @@ def readMTX(path):
     deviations \n
     """
 
-    data = []
+    # Map the file and convert the whitespace separated covariance block
+    with open(path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            # Read header line
+            headerEnd = mm.find(b'\n') + 1
+            bins = int(mm[:headerEnd].split()[0])
 
-    # Open file
-    try:
-        f = open(path, 'r')
-        # Read header lines
-        bins = int(f.next().split()[0])
+            data = np.array(mm[headerEnd:].split(), dtype=float)
+        finally:
+            mm.close()
 
-        # Read the file line by line and store the values
-        tmp = []
-        for line in f:
-            if len(tmp) < bins:
-                tmp.extend(line.split())
-                if len(tmp) == bins:
-                    data.append(tmp)
-                    tmp = []
-            else:
-                print 'ERROR: MTX read error. Covariance length !=  # bins.'
-
-        # Close the file
-        f.close()
-    except IOError as e:
-        print "I/O error({0}): {1}".format(e.errno, e.strerror)
+    assert data.size == bins*bins, \
+        'MTX read error. Covariance length != # bins.'
 
-    # Determine the standard deviation
-    data = np.sqrt(np.diag(np.asarray(data).astype(float)))
+    # Determine the standard deviation from a strided view of the diagonal
+    data = np.sqrt(data[::bins+1])
 
     return data
 
@@ -130,40 +160,39 @@ def readRSP(path, minE=None, maxE=None, minPH=None, maxPH=None):
     # Initialize Variables
     data = []
     eBins = []
+    seenE = set()
     if minE == None:
         minE = 0
     if maxE == None:
         maxE = 1000
 
-    # Open file
-    try:
-        f = open(path, 'r')
+    with open(path, 'r', buffering=2**20) as f:
         # Skip the first header
-        line = f.next()
-        phScale = float(line.rstrip().split()[0])
-        line = f.next()
-        curE = float(line.rstrip().split()[0])
-        numPHBins = float(line.rstrip().split()[1])
-        phLowBound = float(line.rstrip().split()[2])
+        phScale = float(next(f).split()[0])
+        splitList = next(f).split()
+        curE = float(splitList[0])
+        numPHBins = int(float(splitList[1]))
+        phLowBound = float(splitList[2])
         if minPH == None:
             minPH = phLowBound
-        phUpBound = float(line.rstrip().split()[3])
+        phUpBound = float(splitList[3])
         if maxPH == None:
             maxPH = phUpBound
         count = 1
 
-        # Read the file line by line and store the values
-        tmp = []
+        # Read the file line by line and store the values as raw doubles
+        tmp = array('d')
         for line in f:
-            splitList = line.rstrip().split()
+            splitList = line.split()
             if len(splitList) == 4 and float(splitList[3]) == phUpBound:
-                curE = float(line.rstrip().split()[0])
-                if tmp != []:
+                curE = float(splitList[0])
+                if len(tmp) > 0:
                     data.append(tmp)
-                    tmp = []
+                    tmp = array('d')
                 count = 1
             elif curE >= minE and curE <= maxE:
-                if curE not in eBins:
+                if curE not in seenE:
+                    seenE.add(curE)
                     eBins.append(curE)
                 for item in splitList:
                     if count*phScale >= minPH and count*phScale <= maxPH:
@@ -173,14 +202,10 @@ def readRSP(path, minE=None, maxE=None, minPH=None, maxPH=None):
         # Append last data set
         data.append(tmp)
 
-        # Close the file
-        f.close()
-    except IOError as e:
-        print "I/O error({0}): {1}".format(e.errno, e.strerror)
-
-    for row in data:
-        while len(row) < len(data[-1]):
-            row.append(0.0)
+    # Zero pad short rows by filling a preallocated response matrix
+    rsp = np.zeros((len(data), len(data[-1])))
+    for i, row in enumerate(data):
+        rsp[i, :len(row)] = row
 
-    return np.transpose(np.asarray(data)), eBins, \
+    return np.transpose(rsp), eBins, \
            np.linspace(phScale, phUpBound, numPHBins)
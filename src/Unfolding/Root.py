@@ -14,6 +14,8 @@
 import os
 import sys
 
+import numpy as np
+
 from datetime import datetime
 
 from GeneralNuclear.BasicNuclearCalcs import solid_angle_approx
@@ -64,6 +66,11 @@ class CalibParams(object):
             # \sqrt{\alpha^2 + \frac{\beta^2}{E} + \frac{\gamma^2}{E^2}}\f$
             self.gamma = params[4]
 
+            # Squared resolution parameters reused by gamma_of()
+            self._a2 = self.alpha**2
+            self._b2 = self.beta**2
+            self._g2 = self.gamma**2
+
     def __repr__(self):
         """!
         Object print function.
@@ -107,24 +114,51 @@ class CalibParams(object):
 
         params = []
 
-        # Open file
-        try:
-            f = open(path, 'r')
-
+        with open(path, 'r', buffering=2**20) as f:
             # Skip 1 header lines
-            f.next()
+            next(f)
 
-            # Read the file line by line and store the values
+            # Read the file line by line and store the values as floats
             for i in range(5):
-                params.append(f.next().rstrip())
-
-            # Close the file
-            f.close()
-        except IOError as e:
-            print "I/O error({0}): {1}".format(e.errno, e.strerror)
+                params.append(float(next(f).split()[0]))
 
         return params
 
+    def channel_to_energy(self, ch):
+        """!
+        Converts channel number(s) to energy using the linear calibration
+        \f$E=a*Ch+b\f$.
+
+        @param self: <em> object pointer </em> \n
+            The object pointer. \n
+        @param ch: <em> integer, float, or array of floats </em> \n
+            The channel number(s) to convert \n
+
+        @return <em> float or array of floats </em>: The energy of each
+            channel \n
+        """
+
+        return self.a*np.asarray(ch, dtype=float) + self.b
+
+    def gamma_of(self, E):
+        """!
+        Evaluates the resolution function \f$\Gamma(E)=\sqrt{\alpha^2 +
+        \frac{\beta^2}{E} + \frac{\gamma^2}{E^2}}\f$ for all energies at
+        once.
+
+        @param self: <em> object pointer </em> \n
+            The object pointer. \n
+        @param E: <em> float or array of floats </em> \n
+            The energies at which to evaluate the resolution \n
+
+        @return <em> float or array of floats </em>: The resolution at each
+            energy \n
+        """
+
+        E = np.asarray(E, dtype=float)
+
+        return np.sqrt(self._a2 + self._b2/E + self._g2/(E*E))
+
 
 #------------------------------------------------------------------------------#
 class FluxNormalization(object):
@@ -235,18 +269,14 @@ class FluxNormalization(object):
         if stopTime == None:
             stopTime = datetime(2084, 8, 2, 12, 12, 0)
 
-        # Open file
-        try:
-            f = open(path, 'r')
-
+        with open(path, 'r', buffering=2**20) as f:
             # Store first time slice
-            line = f.next().rstrip().split('\t')
-            prevTime = datetime.strptime(line[0]+line[1], '%m/%d/%Y%I:%M:%S %p')
+            line = next(f).rstrip().split('\t')
+            prevTime = _monitor_time(line[0], line[1])
 
             for line in f:
                 line = line.rstrip().split('\t')
-                curTime = datetime.strptime(line[0]+line[1],
-                                            '%m/%d/%Y%I:%M:%S %p')
+                curTime = _monitor_time(line[0], line[1])
 
                 # Reading occurred during the experiment and isn't noise
                 if curTime > startTime and curTime < stopTime and \
@@ -256,11 +286,8 @@ class FluxNormalization(object):
                                         *(curTime-prevTime).total_seconds()
                 prevTime = curTime
 
-            # Close the file and set currentMonitor
-            self.currentMonitor = self.currentMonitor*1E6/scale
-            f.close()
-        except IOError as e:
-            print "I/O error({0}): {1}".format(e.errno, e.strerror)
+        # Set currentMonitor
+        self.currentMonitor = self.currentMonitor*1E6/scale
 
     def set_solid_angle(self, dist, area):
         """!
@@ -292,3 +319,32 @@ class FluxNormalization(object):
         assert hasattr(func, '__call__'), 'Invalid function handle'
 
         self.deadTime = func(**kwargs)[1]
+
+#------------------------------------------------------------------------------#
+def _monitor_time(date, time):
+    """!
+    @ingroup Root
+    Converts the date and time columns of a current monitor file to a
+    datetime object. This is equivalent to parsing date+time with the format
+    '%m/%d/%Y%I:%M:%S %p', but splits the fields directly instead of
+    reparsing the format string on every line.
+
+    @param date: \e string \n
+        The date column formatted as mm/dd/yyyy \n
+    @param time: \e string \n
+        The time column formatted as hh:mm:ss AM or hh:mm:ss PM \n
+
+    @return \e datetime: The time stamp of the reading \n
+    """
+
+    month, day, year = date.split('/')
+    clock, meridiem = time.split()
+    hour, minute, second = clock.split(':')
+
+    # Convert the 12 hour clock to a 24 hour clock
+    hour = int(hour) % 12
+    if meridiem.upper() == 'PM':
+        hour += 12
+
+    return datetime(int(year), int(month), int(day), hour, int(minute),
+                    int(second))
@@ -222,9 +222,9 @@ def integralXSecEst(firPath, numRx, firName='stayslin.out',
     # Integrate out per MeV and normalize
     flux = bin_integration(ebin, flux, 'low')
     print "The epithermal/thermal ratio is: {}\n".format(
-                                           sum(flux[start[0]:start[1]])\
-                                           /sum(flux[:start[0]]))
-    flux = np.asarray(flux)/sum(flux)
+                                           flux[start[0]:start[1]].sum()\
+                                           /flux[:start[0]].sum())
+    flux = flux/flux.sum()
 
     # Open XSec file
     try:
@@ -460,8 +460,8 @@ class IterativeSTAYSL(object):
                                   'integralFlux', 'intFluxUncert'])
         self._df.apply(pd.to_numeric)
         self._df['adjDiff'] = self._df['adjFlux'].tolist()
-        self._df['adjFlux'] = bin_integration(self._df['lowE'].tolist(), 
-                                             self._df['adjFlux'].tolist(), 'low')
+        self._df['adjFlux'] = bin_integration(self._df['lowE'],
+                                              self._df['adjFlux'], 'low')
         self._df['adjStd'] = self._df['adjStd'] / 100
         self._stdNorm = np.linalg.norm(self._df['adjStd'].tolist(), self.norm)
 